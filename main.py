@@ -551,14 +551,20 @@ class Game:
                     cap = int(props.get('spawn_cap', 1)) if props.get('spawn_cap') is not None else 1
                     # cap per region to avoid huge crowds
                     max_per_region = min(cap, 3)
+                    # Allowed surfaces and enemy classes only depend on the region, so resolve
+                    # them once and draw the class of every slot in a single call
+                    if surface == 'ground':
+                        allowed = ('ground', 'both')
+                        candidates = [Bug, Frog, Archer]
+                    elif surface == 'air':
+                        allowed = ('air', 'both')
+                        candidates = [Bee, WizardCaster]
+                    else:
+                        allowed = ('ground', 'air', 'both')
+                        candidates = [Bug, Bee, Archer]
+                    enemy_classes = _rnd.choices(candidates, k=max_per_region)
+                    # Positions stay sequential: each pick must keep its distance from earlier ones
                     for i in range(max_per_region):
-                        allowed = None
-                        if surface == 'ground':
-                            allowed = ('ground', 'both')
-                        elif surface == 'air':
-                            allowed = ('air', 'both')
-                        else:
-                            allowed = ('ground', 'air', 'both')
                         try:
                             # Use minimum distance of 3 tiles between spawns to prevent crowding
                             tile_choice = level_loader.choose_spawn_tile(
@@ -579,15 +585,8 @@ class Game:
                         
                         cx = int(tx * TILE + TILE // 2)
                         ground_y = int((ty + 1) * TILE)
-                        # pick enemy class based on surface
                         try:
-                            if surface == 'air':
-                                EnemyClass = _rnd.choice([Bee, WizardCaster])
-                            elif surface == 'ground':
-                                EnemyClass = _rnd.choice([Bug, Frog, Archer])
-                            else:
-                                EnemyClass = _rnd.choice([Bug, Bee, Archer])
-                            spawned.append(EnemyClass(cx, ground_y))
+                            spawned.append(enemy_classes[i](cx, ground_y))
                         except Exception:
                             try:
                                 spawned.append(Bug(cx, ground_y))
@@ -817,20 +816,17 @@ class Game:
                 self.last_space_time = pygame.time.get_ticks()
             self._prev_space_pressed = space_pressed
 
- # Legacy door system for static rooms
-        for d in getattr(self.level, "doors", []):
-            if self.player.rect.colliderect(d):
-                # Boss gate logic preserved for legacy/boss-style levels
-                if getattr(self.level, 'is_boss_room', False):
-                    if any(getattr(e, 'alive', False) for e in self.enemies):
-                        # door locked; stay in room
-                        pass
-                    else:
-                        self.switch_room(+1)
-                        break
+ # Legacy door system for static rooms; one collidelist call finds the touched door
+        if self.player.rect.collidelist(getattr(self.level, "doors", [])) != -1:
+            # Boss gate logic preserved for legacy/boss-style levels
+            if getattr(self.level, 'is_boss_room', False):
+                if any(getattr(e, 'alive', False) for e in self.enemies):
+                    # door locked; stay in room
+                    pass
                 else:
                     self.switch_room(+1)
-                    break
+            else:
+                self.switch_room(+1)
 
         # Update alert system for enemy coordination
         alert_system.update()
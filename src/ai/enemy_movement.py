@@ -186,7 +186,7 @@ class GroundPatrolStrategy(MovementStrategy):
             test_rect = pygame.Rect(x - enemy.rect.width//2, y - enemy.rect.height, 
                                    enemy.rect.width, enemy.rect.height)
             
-            if not any(test_rect.colliderect(solid) for solid in level.solids):
+            if test_rect.collidelist(level.solids) == -1:
                 return (x, y)
         
         return None
@@ -577,7 +577,7 @@ class RangedTacticalStrategy(MovementStrategy):
         if not level.solids:
             return False
         probe = pygame.Rect(enemy.rect.left, enemy.rect.bottom + 1, enemy.rect.width, 2)
-        return any(probe.colliderect(solid) for solid in level.solids)
+        return probe.collidelist(level.solids) != -1
     
     def _has_support_in_direction(self, enemy, level, direction, distance=4) -> bool:
         """Check if ground exists ahead in the given direction.
@@ -590,7 +590,7 @@ class RangedTacticalStrategy(MovementStrategy):
         # Look slightly ahead from the bottom center; this avoids overreacting to minor offsets.
         ahead = enemy.rect.centerx + direction * max(distance, 4)
         probe = pygame.Rect(ahead - 2, enemy.rect.bottom + 1, 4, 3)
-        return any(probe.colliderect(solid) for solid in level.solids)
+        return probe.collidelist(level.solids) != -1
 
     def _set_safe_horizontal_velocity(self, enemy, level, desired_vx):
         """Apply horizontal velocity with ledge awareness for grounded Archers.
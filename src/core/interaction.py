@@ -98,24 +98,25 @@ def find_spawn_point(
     if not tile_grid:
         return None
     
+    # Resolve which tile values qualify once, instead of per cell
+    expected_id = f"entrance:{entrance_id}" if entrance_id else None
+    spawn_values = set()
+    for tile_type in TileType:
+        tile_data = tile_registry.get_tile(tile_type)
+        if not tile_data or not tile_data.interaction.is_spawn_point:
+            continue
+        if expected_id and tile_data.interaction.on_interact_id != expected_id:
+            continue
+        spawn_values.add(tile_type.value)
+    
+    if not spawn_values:
+        return None
+    
     for ty, row in enumerate(tile_grid):
-        for tx, tile_value in enumerate(row):
-            if tile_value < 0:
-                continue
-                
-            tile_type = TileType(tile_value)
-            tile_data = tile_registry.get_tile(tile_type)
-            
-            if not tile_data or not tile_data.interaction.is_spawn_point:
-                continue
-            
-            # If entrance_id is specified, match it
-            if entrance_id:
-                expected_id = f"entrance:{entrance_id}"
-                if tile_data.interaction.on_interact_id != expected_id:
-                    continue
-            
-            return (tx, ty)
+        if spawn_values.isdisjoint(row):
+            continue
+        # list.index scans in C; take the leftmost qualifying tile in the row
+        return (min(row.index(v) for v in spawn_values if v in row), ty)
     
     return None
 
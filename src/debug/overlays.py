@@ -82,10 +82,10 @@ class DebugOverlays:
             tx = int(world_x // TILE)
             ty = int(world_y // TILE)
 
-            hover_regions = [r for r in regions if r.contains_tile(tx, ty)]
-            if hover_regions:
-                hover_regions.sort(key=lambda r: r.priority, reverse=True)
-                top = hover_regions[0]
+            # Highest-priority region under the cursor (first one wins ties)
+            top = max((r for r in regions if r.contains_tile(tx, ty)),
+                      key=lambda r: r.priority, default=None)
+            if top is not None:
                 info_lines = [f"{top.region_id} ({top.kind})"]
                 for k, v in top.properties.items():
                     info_lines.append(f"{k}: {v}")
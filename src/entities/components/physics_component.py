@@ -197,10 +197,7 @@ class PhysicsComponent:
             # Fall back to solid list for backward compatibility
             temp_rect = self.entity.rect.copy()
             temp_rect.x = new_x
-            for solid in level.solids:
-                if temp_rect.colliderect(solid):
-                    return True
-            return False
+            return temp_rect.collidelist(level.solids) != -1
 
         # Use new tile collision system
         temp_rect = self.entity.rect.copy()
@@ -219,10 +216,7 @@ class PhysicsComponent:
             # Fall back to solid list for backward compatibility
             temp_rect = self.entity.rect.copy()
             temp_rect.y = new_y
-            for solid in level.solids:
-                if temp_rect.colliderect(solid):
-                    return True
-            return False
+            return temp_rect.collidelist(level.solids) != -1
 
         # Use new tile collision system
         temp_rect = self.entity.rect.copy()
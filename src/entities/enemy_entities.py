@@ -15,7 +15,7 @@ from config import (
     POGO_BOUNCE_VY, ACCENT, GREEN, CYAN, RED, WHITE, IFRAME_BLINK_INTERVAL,
     TILE
 )
-from src.core.utils import los_clear, find_intermediate_visible_point, find_idle_patrol_target, resource_path
+from src.core.utils import los_clear, find_intermediate_visible_point, find_idle_patrol_target, resource_path, get_font
 from src.entities.entity_common import Hitbox, DamageNumber, hitboxes, floating, in_vision_cone
 from src.entities.player_entity import Player
 from src.ai.enemy_movement import MovementStrategyFactory
@@ -23,6 +23,19 @@ from src.entities.components.combat_component import CombatComponent
 
 logger = logging.getLogger(__name__)
 
+# Rendered telegraph glyphs ('!', '!!', ...) keyed by (text, color, size, bold).
+# Telegraphs are drawn every frame while active, so rasterize each one only once.
+_TELE_CACHE = {}
+
+
+def _tele_surface(text, color, size=18, bold=True):
+    key = (text, color, size, bold)
+    surf = _TELE_CACHE.get(key)
+    if surf is None:
+        surf = get_font(size=size, bold=bold).render(text, True, color)
+        _TELE_CACHE[key] = surf
+    return surf
+
 
 class ChargeAttackSystem:
     """
@@ -125,6 +138,35 @@ class ChargeAttackSystem:
 
 class Enemy:
     """Base class for all enemy types with shared functionality."""
+
+    # Fixed attribute layout. Subclasses that declare their own __slots__ drop
+    # the per-instance __dict__; this list must also cover attributes written
+    # from outside the class (status effects, movement strategies, components).
+    __slots__ = (
+        'rect', 'vx', 'vy', 'x', 'y', 'combat', 'alive', 'type',
+        # Vision cone / memory
+        'vision_range', 'cone_half_angle', 'turn_rate', 'facing', 'facing_angle',
+        'last_seen_pos', 'pursuit_timer', 'pursuit_duration', 'alert_level',
+        'investigation_point', 'idle_look_direction', '_has_los', '_los_point', '_eye_pos',
+        # Status effects (also applied by on-hit effects, items and player skills)
+        'slow_mult', 'slow_remaining', 'stunned', 'frozen',
+        'poison_stacks', 'poison_dps', 'poison_remaining',
+        'burn_dps', 'burn_remaining', 'bleed_dps', 'bleed_remaining',
+        'dot_dps', 'dot_remaining', 'dot_accum',
+        # AI state
+        'state', 'home', 'target', 'last_seen', 'repath_t',
+        'tele_t', 'tele_text', 'cool', 'action', 'attacking', 'can_jump',
+        # Movement (also written by src.ai.enemy_movement strategies)
+        'movement_strategy', 'speed_multiplier', 'terrain_traits', 'on_ground',
+        'on_left_wall', 'on_right_wall', 'base_speed', 'iframes_flash', 'draw_border_radius',
+        'patrol_direction', 'patrol_timer', 'patrol_target', 'patrol_blocked', 'blocked_cooldown',
+        # Physics
+        'friction', 'gravity_affected', 'sliding', 'stuck', 'stuck_timer',
+        # Sprites / animation
+        'sprite_idle', 'sprite', 'sprite_offset_y', 'sprite_rect', 'anim_manager',
+        'atk_frames', 'play_attack_anim', 'atk_index', 'atk_timer', 'atk_speed',
+        'projectile_sprite', 'projectile_hitboxes',
+    )
     
     def __init__(self, x, ground_y, width, height, combat_config, vision_range=200, cone_half_angle=math.pi/6, turn_rate=0.05):
         # Basic properties
@@ -547,9 +589,8 @@ class Enemy:
             # Check collision with solids
             temp_rect = pygame.Rect(int(x) - self.rect.width//2, int(y) - self.rect.height//2,
                                   self.rect.width, self.rect.height)
-            for s in level.solids:
-                if temp_rect.colliderect(s):
-                    return False
+            if temp_rect.collidelist(level.solids) != -1:
+                return False
         
         return True
     
@@ -558,10 +599,7 @@ class Enemy:
         # Simple validation - no collision with solids
         temp_rect = pygame.Rect(position[0] - self.rect.width//2, position[1] - self.rect.height//2,
                               self.rect.width, self.rect.height)
-        for s in level.solids:
-            if temp_rect.colliderect(s):
-                return False
-        return True
+        return temp_rect.collidelist(level.solids) == -1
     
     def handle_gravity(self, level, gravity_multiplier=2.0):
         """Apply gravity and handle ground collision."""
@@ -675,9 +713,8 @@ class Enemy:
                 draw_text(surf, state_text, (center[0] - 20, center[1] - 30), state_color, size=12, bold=True)
 
     def draw_telegraph(self, surf, camera, text, color=(255, 80, 80)):
-        from src.core.utils import draw_text, resource_path
         if text:
-            draw_text(surf, text, camera.to_screen((self.rect.centerx-4, self.rect.top-10)), color, size=18, bold=True)
+            surf.blit(_tele_surface(text, color), camera.to_screen((self.rect.centerx-4, self.rect.top-10)))
     
     def get_status_effect_color(self, base_color):
         """Returns a color modified by current status effects.
@@ -933,8 +970,7 @@ class Enemy:
         self.draw_status_effects(surf, camera)
         tele_text = getattr(self, 'tele_text', '')
         if getattr(self, 'tele_t', 0) > 0 and tele_text:
-            from src.core.utils import draw_text, resource_path
-            draw_text(surf, tele_text, camera.to_screen((self.rect.centerx-4, self.rect.top-10)), (255,200,80), size=18, bold=True)
+            surf.blit(_tele_surface(tele_text, (255,200,80)), camera.to_screen((self.rect.centerx-4, self.rect.top-10)))
         # Name and HP
         self.draw_nametag(surf, camera, show_nametags)
 
@@ -1418,8 +1454,7 @@ class Frog(Enemy):
         
         # Draw telegraph
         if getattr(self, 'tele_t', 0) > 0 and getattr(self, 'tele_text', ''):
-            from src.core.utils import draw_text, resource_path
-            draw_text(surf, self.tele_text, camera.to_screen((self.rect.centerx-4, self.rect.top-10)), (255,200,80), size=18, bold=True)
+            surf.blit(_tele_surface(self.tele_text, (255,200,80)), camera.to_screen((self.rect.centerx-4, self.rect.top-10)))
         
         # Draw nametag
         self.draw_nametag(surf, camera, show_nametags)
@@ -1672,8 +1707,7 @@ class Archer(Enemy):
         
         # Draw telegraph during charge phase
         if self.charge_system.is_charging() and self.tele_text:
-            from src.core.utils import draw_text, resource_path
-            draw_text(surf, self.tele_text, camera.to_screen((self.rect.centerx-4, self.rect.top-10)), (255,200,80), size=18, bold=True)
+            surf.blit(_tele_surface(self.tele_text, (255,200,80)), camera.to_screen((self.rect.centerx-4, self.rect.top-10)))
         
         # Draw charge/cooldown debug info (F3)
         if debug_hitboxes and (self.charge_system.is_charging() or self.charge_system.is_cooldown()):
@@ -1727,6 +1761,12 @@ class Archer(Enemy):
 
 class WizardCaster(Enemy):
     """Casts fast magic bolts with '!!' telegraph."""
+    __slots__ = (
+        'fireball_charge', 'bolt_charge', 'missile_charge', 'current_charge_system',
+        'floating_active', 'floating_timer', 'floating_duration', 'floating_cooldown',
+        'floating_cooldown_timer', 'projectile_animations', '_landing_frames',
+    )
+
     def __init__(self, x, ground_y):
         combat_config = {
             'max_hp': 10,
@@ -2212,8 +2252,7 @@ class WizardCaster(Enemy):
         
         # Draw telegraph during charge phase
         if self.current_charge_system and self.current_charge_system.is_charging() and self.tele_text:
-            from src.core.utils import draw_text, resource_path
-            draw_text(surf, self.tele_text, camera.to_screen((self.rect.centerx-4, self.rect.top-10)), (255,200,80), size=18, bold=True)
+            surf.blit(_tele_surface(self.tele_text, (255,200,80)), camera.to_screen((self.rect.centerx-4, self.rect.top-10)))
         
         # Draw charge/cooldown debug info (F3)
         if debug_hitboxes and self.current_charge_system and (self.current_charge_system.is_charging() or self.current_charge_system.is_cooldown()):
@@ -2318,6 +2357,8 @@ class WizardCaster(Enemy):
 
 class Assassin(Enemy):
     """Semi-invisible melee dash enemy."""
+    __slots__ = ('dash_t', 'jump_cooldown', '_in_cone')
+
     def __init__(self, x, ground_y):
         combat_config = {
             'max_hp': 18,
@@ -2338,6 +2379,10 @@ class Assassin(Enemy):
         self.can_jump = True
         self.jump_cooldown = 0  # Prevent continuous jumping
         self.attacking = False
+        self._in_cone = False
+        # Idle patrol state (direction is picked on the first idle frame)
+        self.patrol_direction = None
+        self.patrol_timer = 60
         
         # Initialize animation system
         from src.entities.animation_system import AnimationManager, AnimationState
@@ -2436,11 +2481,17 @@ class Assassin(Enemy):
          
         if self.cool > 0:
             self.cool -= 1
-        if getattr(self, 'jump_cooldown', 0) > 0:
+        if self.jump_cooldown > 0:
             self.jump_cooldown -= 1
          
         ppos = (player.rect.centerx, player.rect.centery)
-        has_los, in_cone = self.check_vision_cone(level, ppos)
+        if self.tele_t > 0 or self.state == 'dash':
+            # Mid-action the branches below never read LOS, so skip the raycast.
+            # Memory is fed has_los=False so it decays instead of tracking the
+            # player through walls; the cone flag carries over from last frame.
+            has_los, in_cone = False, self._in_cone
+        else:
+            has_los, in_cone = self.check_vision_cone(level, ppos)
         dist_to_player = self.update_vision_cone_and_memory(ppos, has_los)
         
         epos = (self.rect.centerx, self.rect.centery)
@@ -2490,8 +2541,7 @@ class Assassin(Enemy):
                 hb.midright = (self.rect.left, self.rect.centery)
             hitboxes.append(Hitbox(hb, 6, 1, self, dir_vec=(self.facing, 0)))
              
-            old_vy = getattr(self, 'vy', 0)
-            self.vy = old_vy + min(GRAVITY, 10)
+            self.vy += min(GRAVITY, 10)
             
             old_rect = self.rect.copy()
             self.rect.x += int(self.vx)
@@ -2523,7 +2573,7 @@ class Assassin(Enemy):
                 self.state = 'idle'
                 self.cool = 60
                 self.action = None
-                if getattr(self, 'on_ground', False):
+                if self.on_ground:
                     self.vy = 0
                 self.vx *= 0.6
                 if abs(self.vx) < 0.8:
@@ -2542,7 +2592,7 @@ class Assassin(Enemy):
                 self.tele_text = '!!'
         else:
             # Movement behavior based on alert level
-            alert_level = getattr(self, 'alert_level', 0)
+            alert_level = self.alert_level
             
             if has_los and dist_to_player < self.vision_range:
                 # Can see player - move toward them
@@ -2557,15 +2607,13 @@ class Assassin(Enemy):
                 else:
                     self.vx = 0
                     
-                jump_cooldown = getattr(self, 'jump_cooldown', 0)
-                if (hasattr(self, 'can_jump') and self.can_jump and dy < -50 and
-                    getattr(self, 'on_ground', False) and jump_cooldown <= 0):
+                if self.can_jump and dy < -50 and self.on_ground and self.jump_cooldown <= 0:
                     self.vy = -10
                     self.on_ground = False
                     self.jump_cooldown = 30
             elif alert_level == 1:
                 # Investigating - move toward last known position
-                inv_point = getattr(self, 'investigation_point', None)
+                inv_point = self.investigation_point
                 if inv_point is not None and isinstance(inv_point, tuple) and len(inv_point) == 2:
                     inv_x, inv_y = inv_point
                     dx_inv = inv_x - epos[0]
@@ -2583,15 +2631,12 @@ class Assassin(Enemy):
                 # Idle patrol with stable direction changes
                 import random as rnd
                 
-                # Initialize patrol state if needed
-                if not hasattr(self, 'patrol_direction'):
+                # Pick the initial patrol direction on the first idle frame
+                if self.patrol_direction is None:
                     self.patrol_direction = rnd.choice([-1.5, 1.5])  # Start moving
                     self.patrol_timer = rnd.randint(45, 90)  # Hold direction for 0.75-1.5 seconds
                 
                 # Count down patrol timer
-                if not hasattr(self, 'patrol_timer'):
-                    self.patrol_timer = 60
-                
                 self.patrol_timer -= 1
                 
                 # Only change direction when timer expires
@@ -2658,8 +2703,7 @@ class Assassin(Enemy):
 
     def get_base_color(self):
         """Get the base color for Assassin enemy."""
-        in_cone = getattr(self, '_in_cone', False)
-        if in_cone:
+        if self._in_cone:
             return (60,60,80) if not self.combat.is_invincible() else (40,40,60)
         else:
             return (30,30,40) if not self.combat.is_invincible() else (20,20,30)
@@ -2689,9 +2733,8 @@ class Assassin(Enemy):
         self.draw_status_effects(surf, camera)
         
         # Draw telegraph
-        if getattr(self, 'tele_t', 0) > 0 and getattr(self, 'tele_text', ''):
-            from src.core.utils import draw_text, resource_path
-            draw_text(surf, self.tele_text, camera.to_screen((self.rect.centerx-4, self.rect.top-10)), (255,200,80), size=18, bold=True)
+        if self.tele_t > 0 and self.tele_text:
+            surf.blit(_tele_surface(self.tele_text, (255,200,80)), camera.to_screen((self.rect.centerx-4, self.rect.top-10)))
         
         # Draw nametag
         self.draw_nametag(surf, camera, show_nametags)
@@ -2699,6 +2742,8 @@ class Assassin(Enemy):
 
 class Bee(Enemy):
     """Hybrid shooter/dasher with two-phase attack cycle: charge (1s) then cooldown (1s)."""
+    __slots__ = ('attack_phase', 'attack_timer', 'sting_spawned')
+
     def __init__(self, x, ground_y):
         combat_config = {
             'max_hp': 14,
@@ -2927,8 +2972,7 @@ class Bee(Enemy):
         
         # Draw telegraph during charge phase
         if self.attack_phase == 'charging' and self.tele_text:
-            from src.core.utils import draw_text, resource_path
-            draw_text(surf, self.tele_text, camera.to_screen((self.rect.centerx-4, self.rect.top-10)), (255,200,80), size=18, bold=True)
+            surf.blit(_tele_surface(self.tele_text, (255,200,80)), camera.to_screen((self.rect.centerx-4, self.rect.top-10)))
         
         # Draw attack phase debug info (F3)
         if debug_hitboxes and self.attack_phase is not None:
@@ -2980,6 +3024,8 @@ class Bee(Enemy):
 
 class Golem(Enemy):
     """Elite enemy with random pattern: dash (!), shoot (!!), stun (!!). Features sprite animations."""
+    __slots__ = ('aura_sprite',)
+
     def __init__(self, x, ground_y):
         combat_config = {
             'max_hp': 30,
@@ -3092,7 +3138,12 @@ class Golem(Enemy):
         
         # INTEGRATION: Friend's simple LOS + Your advanced vision system
         # Option 1: Friend's original simple LOS (current)
-        has_los = los_clear(level, epos, ppos)
+        # LOS is only read when the telegraphed shot fires or when picking the
+        # next attack off cooldown, so skip the raycast on every other frame.
+        if self.tele_t > 0:
+            has_los = self.tele_t == 1 and self.action == "shoot" and los_clear(level, epos, ppos)
+        else:
+            has_los = self.cool == 0 and los_clear(level, epos, ppos)
         
         # Option 2: Use your advanced vision cone system (uncomment to enable)
         # has_los, in_cone = self.check_vision_cone(level, ppos)
@@ -3242,13 +3293,8 @@ class Golem(Enemy):
         
         # Telegraph
         if self.tele_t > 0:
-            from src.core.utils import draw_text, resource_path
             tele_pos = (self.rect.centerx-6, self.rect.top-12)
-            draw_text(
-                surf, self.tele_text,
-                camera.to_screen(tele_pos),
-                (255,120,90), size=22, bold=True
-            )
+            surf.blit(_tele_surface(self.tele_text, (255,120,90), size=22), camera.to_screen(tele_pos))
         
         # Draw status effect indicators
         self.draw_status_effects(surf, camera)
@@ -3694,14 +3740,9 @@ class KnightMonster(Enemy):
         
         # Draw telegraph
         if self.telegraph_timer > 0 and self.tele_text:
-            from src.core.utils import draw_text, resource_path
-            draw_text(
-                surf, 
-                self.tele_text,
-                camera.to_screen((self.rect.centerx - 4, self.rect.top - 10)),
-                ACCENT,
-                size=18,
-                bold=True
+            surf.blit(
+                _tele_surface(self.tele_text, ACCENT),
+                camera.to_screen((self.rect.centerx - 4, self.rect.top - 10))
             )
         
         # Draw nametag
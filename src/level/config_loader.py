@@ -5,8 +5,9 @@ import os
 from typing import Dict, Any, NamedTuple
 import sys
 
-# Add project root to path for imports
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+# Ensure project root is on path when running this module directly
+if __name__ == "__main__":
+    sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from src.level.pcg_level_data import PCGConfig
 
@@ -5,117 +5,147 @@ and loader can call to place door tiles into a room tile grid. It
 ensures placed door metadata is always recorded and avoids any legacy
 fixed-position logic.
 """
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Set, Tuple
 import random
+from array import array
+from config import TILE_AIR
 from src.tiles.tile_types import TileType
-from src.level.pcg_level_data import RoomData
+from src.level.pcg_level_data import RoomData, placed_door_entry
+from src.level.pcg_generator_simple import is_first_room_first_level
 
+# Door tile value written for each door key
+_DOOR_TILE_BY_KEY = {
+    'entrance': TileType.DOOR_ENTRANCE.value,
+    'door_exit_1': TileType.DOOR_EXIT_1.value,
+    'door_exit_2': TileType.DOOR_EXIT_2.value,
+}
 
-def _place_single_door_from_carve(tile_grid: List[List[int]], door_key: str, room: RoomData, rng: Optional[random.Random] = None) -> Optional[Dict]:
-    """Place a single-block door tile for `door_key` into `tile_grid`."""
-    rng = rng or random.Random()
-    h = len(tile_grid)
-    w = len(tile_grid[0]) if h > 0 else 0
-    if h == 0 or w == 0:
-        return None
-
-    from src.tiles.tile_types import TileType as _TT
-    from config import TILE_AIR
-
-    def _record(tx: int, ty: int, tile_type: _TT, role: str, key: str):
-        entry = {"tx": tx, "ty": ty, "tile": tile_type.value, "role": role}
-        if role == "exit":
-            entry["exit_key"] = key
-            entry["target"] = (room.door_exits or {}).get(key)
-        elif role == "entrance":
-            entry["source"] = room.entrance_from
-        
-        if not hasattr(room, 'placed_doors') or room.placed_doors is None:
-            room.placed_doors = []
-        if not isinstance(room.placed_doors, list):
-            room.placed_doors = []
-        room.placed_doors.append(entry)
+# Tile values cleared by clear_legacy_doors
+_DOOR_TILE_VALUES = frozenset((
+    TileType.DOOR_ENTRANCE.value,
+    TileType.DOOR_EXIT_1.value,
+    TileType.DOOR_EXIT_2.value,
+))
+
+
+def _field(obj, name: str):
+    return obj.get(name) if isinstance(obj, dict) else getattr(obj, name, None)
+
+
+def _normalize_areas(room: RoomData) -> Tuple[List[Optional[str]], List[Optional[str]], array, List[int], Dict[Tuple, List[int]]]:
+    """Flatten `room.areas` into parallel arrays, cached on the room.
+
+    Returns ``(kinds, door_keys, rects, offsets, index)``: area ``i`` has kind
+    ``kinds[i]``, the door_key of its first rect in ``door_keys[i]`` and its
+    rects packed as x, y, w, h in ``rects`` from ``offsets[i]`` up to
+    ``offsets[i + 1]`` (counted in rects). Rects with missing or
+    non-numeric fields are packed as zero-sized so callers skip them.
+    ``index`` maps ``(kind, door_key)`` to the matching area indices.
+    The cache is rebuilt when `room.areas` is replaced or grows.
+    """
+    areas = room.areas
+    cached = getattr(room, '_areas_norm', None)
+    if cached is not None and cached[0] is areas and cached[1] == len(areas):
+        return cached[2]
+
+    kinds: List[Optional[str]] = []
+    door_keys: List[Optional[str]] = []
+    rects = array('i')
+    offsets: List[int] = [0]
+    index: Dict[Tuple, List[int]] = {}
+    for i, area in enumerate(areas):
+        kind = _field(area, 'kind')
+        area_rects = _field(area, 'rects')
+        if not isinstance(area_rects, (list, tuple)):
+            area_rects = ()
+        key = _field(area_rects[0], 'door_key') if area_rects and area_rects[0] else None
+        if not isinstance(kind, str):
+            kind = None
+        if not isinstance(key, str):
+            key = None
+        kinds.append(kind)
+        door_keys.append(key)
+        index.setdefault((kind, key), []).append(i)
+        for rect in area_rects:
+            try:
+                rects.extend((int(float(_field(rect, 'x'))), int(float(_field(rect, 'y'))),
+                              int(float(_field(rect, 'w'))), int(float(_field(rect, 'h')))))
+            except (ValueError, TypeError, OverflowError):
+                rects.extend((0, 0, 0, 0))
+        offsets.append(len(rects) // 4)
+
+    norm = (kinds, door_keys, rects, offsets, index)
+    room._areas_norm = (areas, len(areas), norm)
+    return norm
+
+
+def _placed_doors_index(room: RoomData) -> Tuple[Dict[Optional[str], Dict], Set[Tuple[int, int]]]:
+    """Index `room.placed_doors` by door key and by tile, cached on the room.
+
+    The entrance is keyed as ``'entrance'`` and exits by their exit_key,
+    matching the door keys used by this module. `room.placed_doors` stays
+    the serialized list; the index is rebuilt if that list is replaced or
+    changes length outside `_place_single_door_from_carve`.
+    """
+    placed = room.placed_doors
+    cached = getattr(room, '_placed_doors_index', None)
+    if cached is not None and cached[0] is placed and cached[1] == len(placed):
+        return cached[2], cached[3]
+
+    by_key: Dict[Optional[str], Dict] = {}
+    positions: Set[Tuple[int, int]] = set()
+    for d in placed:
+        key = 'entrance' if d.get('role') == 'entrance' else d.get('exit_key')
+        by_key.setdefault(key, d)
+        positions.add((d.get('tx'), d.get('ty')))
+    room._placed_doors_index = (placed, len(placed), by_key, positions)
+    return by_key, positions
+
+
+def _place_single_door_from_carve(tile_grid: List[List[int]], door_key: str, room: RoomData, w: int, h: int, rng: Optional[random.Random] = None) -> Optional[Dict]:
+    """Place a single-block door tile for `door_key` into `tile_grid`.
+
+    `w` and `h` are the grid dimensions, computed once by the caller.
+    Placement is deterministic; `rng` is accepted for API compatibility only.
+    Raises KeyError for a `door_key` with no door tile.
+    """
+    tile_value = _DOOR_TILE_BY_KEY[door_key]
+    role = 'entrance' if door_key == 'entrance' else 'exit'
+
+    placed_doors = room.placed_doors
+    by_key, positions = _placed_doors_index(room)
+
+    def _record(tx: int, ty: int, tile_value: int, role: str, key: str):
+        entry = placed_door_entry(tx, ty, tile_value, role, exit_key=key,
+                                  target=room.door_exits.get(key), source=room.entrance_from)
+        placed_doors.append(entry)
+        by_key.setdefault(key, entry)
+        positions.add((tx, ty))
+        room._placed_doors_index = (placed_doors, len(placed_doors), by_key, positions)
         return entry
-    
-    # occupied positions from metadata
-    placed_doors = getattr(room, 'placed_doors', None)
-    if placed_doors is None:
-        placed_doors = []
-        room.placed_doors = placed_doors
-    occupied = set(( (d.get('tx'), d.get('ty')) for d in placed_doors ))
 
     # 1) Try generator-carved areas first
-    try:
-        areas = getattr(room, 'areas', []) or []
-        for area in areas:
-            kind = area.get('kind') if isinstance(area, dict) else getattr(area, 'kind', None)
-            
-            # For door_carve areas, door_key is inside rects
-            if kind == 'door_carve':
-                rect = None
-                if isinstance(area, dict):
-                    rects = area.get('rects', [])
-                    if rects:
-                        rect = rects[0]
-                else:
-                    rects = getattr(area, 'rects', None)
-                    if rects:
-                        rect = rects[0]
-                
-                # Get door_key from rect itself
-                rect_door_key = None
-                if rect and isinstance(rect, dict):
-                    rect_door_key = rect.get('door_key')
-                elif rect:
-                    rect_door_key = getattr(rect, 'door_key', None)
-                
-                # Use the passed 'door_key' to find the matching carve area
-                if rect_door_key == door_key and rect:
-                    rx = rect.get('x') if isinstance(rect, dict) else getattr(rect, 'x', None)
-                    ry = rect.get('y') if isinstance(rect, dict) else getattr(rect, 'y', None)
-                    rw = rect.get('w') if isinstance(rect, dict) else getattr(rect, 'w', None)
-                    rh = rect.get('h') if isinstance(rect, dict) else getattr(rect, 'h', None)
-                    
-                    # Validate all values are numeric and reasonable
-                    try:
-                        rx_val = float(rx) if rx is not None else None
-                        ry_val = float(ry) if ry is not None else None
-                        rw_val = float(rw) if rw is not None else None
-                        rh_val = float(rh) if rh is not None else None
-                        
-                        if (rx_val is not None and ry_val is not None and 
-                            rw_val is not None and rh_val is not None and
-                            rx_val >= 0 and ry_val >= 0 and rw_val > 0 and rh_val > 0):
-                            tx = int(rx_val + rw_val // 2)
-                            ty = int(ry_val + rh_val - 1)
-                            
-                            # Avoid placing directly on immediate wall columns; shift inward if needed
-                            if tx == 1 and tx + 1 < w:
-                                tx = 2
-                            elif tx == w - 2 and tx - 1 >= 0:
-                                tx = w - 3
-                            
-                            if 0 <= tx < w and 0 <= ty < h and (tx, ty) not in occupied and tile_grid[ty][tx] == TILE_AIR:
-                                
-                                # Select tile type based on door_key
-                                if door_key == 'entrance':
-                                    tile_type = _TT.DOOR_ENTRANCE
-                                    role = 'entrance'
-                                elif door_key == 'door_exit_2':
-                                    tile_type = _TT.DOOR_EXIT_2
-                                    role = 'exit'
-                                else: # default to exit 1
-                                    tile_type = _TT.DOOR_EXIT_1
-                                    role = 'exit'
-                                
-                                tile_grid[ty][tx] = tile_type.value
-                                return _record(tx, ty, tile_type, role, door_key)
-                        else:
-                            continue
-                    except (ValueError, TypeError):
-                        continue
-    except Exception:
-        pass
+    _kinds, _keys, rects, offsets, index = _normalize_areas(room)
+    # For door_carve areas, door_key is inside the first rect
+    for i in index.get(('door_carve', door_key), ()):
+        if offsets[i] == offsets[i + 1]:
+            continue
+        o = offsets[i] * 4
+        rx, ry, rw, rh = rects[o], rects[o + 1], rects[o + 2], rects[o + 3]
+        if rx < 0 or ry < 0 or rw <= 0 or rh <= 0:
+            continue
+        tx = rx + rw // 2
+        ty = ry + rh - 1
+
+        # Avoid placing directly on immediate wall columns; shift inward if needed
+        if tx == 1 and w > 2:
+            tx = 2
+        elif tx == w - 2 and w > 3:
+            tx = w - 3
+
+        if 0 <= tx < w and 0 <= ty < h and (tx, ty) not in positions and tile_grid[ty][tx] == TILE_AIR:
+            tile_grid[ty][tx] = tile_value
+            return _record(tx, ty, tile_value, role, door_key)
 
     # NO FALLBACK
     return None
@@ -123,47 +153,30 @@ def _place_single_door_from_carve(tile_grid: List[List[int]], door_key: str, roo
 
 def place_all_doors_for_room(room: RoomData, rng: Optional[random.Random] = None) -> None:
     """Place entrance and any exits into room tiles and record metadata."""
-    rng = rng or random.Random()
     h = len(room.tiles)
     w = len(room.tiles[0]) if h>0 else 0
     if h == 0 or w == 0:
         return
 
-    # Initialize placed_doors if needed
-    if not hasattr(room, 'placed_doors') or room.placed_doors is None:
-        room.placed_doors = []
-    elif not isinstance(room.placed_doors, list):
-        room.placed_doors = []
-
     # Place entrance if present and not already recorded
     # Also place entrance for first room of first level even without entrance_from
-    from src.level.pcg_generator_simple import is_first_room_first_level
     should_place_entrance = room.entrance_from or is_first_room_first_level(room)
-    
-    if should_place_entrance:
-        placed_doors_list = room.placed_doors if isinstance(room.placed_doors, list) else []
-        if not any(d.get('role') == 'entrance' for d in placed_doors_list):
-            # Use the carve-aware function for the entrance
-            _place_single_door_from_carve(room.tiles, 'entrance', room, rng=rng)
-
-    # Update the exit loop to call the new function
-    for exit_key in list((room.door_exits or {}).keys()):
+
+    if should_place_entrance and 'entrance' not in _placed_doors_index(room)[0]:
+        # Use the carve-aware function for the entrance
+        _place_single_door_from_carve(room.tiles, 'entrance', room, w, h, rng=rng)
+
+    for exit_key in list(room.door_exits):
         # skip if already present
-        placed_doors_list = room.placed_doors if isinstance(room.placed_doors, list) else []
-        if any(d.get('exit_key') == exit_key for d in placed_doors_list):
+        if exit_key in _placed_doors_index(room)[0]:
             continue
-        # Call the renamed function
-        _place_single_door_from_carve(room.tiles, exit_key, room, rng=rng)
+        _place_single_door_from_carve(room.tiles, exit_key, room, w, h, rng=rng)
 
 
 # Small helper to clear legacy placements (not used by default)
 def clear_legacy_doors(tile_grid: List[List[int]]) -> None:
-    from config import TILE_AIR
-    from src.tiles.tile_types import TileType as _TileType
-    door_values = {_TileType.DOOR_ENTRANCE.value, _TileType.DOOR_EXIT_1.value, _TileType.DOOR_EXIT_2.value}
-    h = len(tile_grid)
-    w = len(tile_grid[0]) if h>0 else 0
-    for ty in range(h):
-        for tx in range(w):
-            if tile_grid[ty][tx] in door_values:
-                tile_grid[ty][tx] = TILE_AIR
\ No newline at end of file
+    for row in tile_grid:
+        # Most rows hold no doors; isdisjoint skips them without a Python-level loop
+        if _DOOR_TILE_VALUES.isdisjoint(row):
+            continue
+        row[:] = [TILE_AIR if v in _DOOR_TILE_VALUES else v for v in row]
@@ -29,6 +29,15 @@ class DoorSystem:
         self.current_room_code: Optional[str] = None
         self.current_tile_grid: Optional[List[List[int]]] = None
         self._last_transition: Optional[Dict[str, Any]] = None
+        # Exit door tiles found in `_door_tiles_grid`, as (tx, ty, tile_val)
+        self._door_tiles_grid: Optional[List[List[int]]] = None
+        self._door_tiles: List[Tuple[int, int, int]] = []
+        # Normalized exits for `_exits_key` == (level_id, room_code)
+        self._exits_key: Optional[Tuple[int, str]] = None
+        self._exits: Dict[str, Dict[str, object]] = {}
+        # get_room results for `_room_cache_set`, keyed by (level_id, room_code)
+        self._room_cache: Dict[Tuple[int, str], Any] = {}
+        self._room_cache_set: Any = None
         
     def set_current_tiles(self, level_id: int, room_code: str, tile_grid: Optional[List[List[int]]] = None) -> None:
         """Set the current room tiles and update room state.
@@ -42,7 +51,22 @@ class DoorSystem:
         self.current_room_code = room_code
         self.current_tile_grid = tile_grid
         self._last_transition = None
+        self._exits_key = None
         
+    def _get_room(self, level_id: int, room_code: str):
+        """Return `level_loader.get_room(...)`, cached until the level set changes."""
+        level_set = self.level_loader.get_level_set()
+        if level_set is not self._room_cache_set:
+            self._room_cache.clear()
+            self._room_cache_set = level_set
+        key = (level_id, room_code)
+        room = self._room_cache.get(key)
+        if room is None:
+            room = self.level_loader.get_room(level_id, room_code)
+            if room is not None and self.level_loader.get_level_set() is level_set:
+                self._room_cache[key] = room
+        return room
+
     def load_room(self, level_id: int, room_code: str) -> None:
         """Load a room and set it as current.
         
@@ -51,7 +75,7 @@ class DoorSystem:
             room_code: The room code
         """
         try:
-            room = self.level_loader.get_room(level_id, room_code)
+            room = self._get_room(level_id, room_code)
             if room:
                 self.set_current_tiles(level_id, room_code, room.tiles)
             else:
@@ -59,6 +83,32 @@ class DoorSystem:
         except Exception as e:
             logger.error(f"Failed to load room {level_id}/{room_code}: {e}")
             
+    def _exit_door_tiles(self) -> List[Tuple[int, int, int]]:
+        """Return the exit door tiles of the current grid in row-major order.
+
+        Door tiles do not move once a room is loaded, so the grid is scanned
+        once per tile grid rather than on every interaction poll.
+        """
+        grid = self.current_tile_grid
+        if grid is not self._door_tiles_grid:
+            exit_values = (TileType.DOOR_EXIT_1.value, TileType.DOOR_EXIT_2.value)
+            self._door_tiles = [
+                (tx, ty, tile_val)
+                for ty, row in enumerate(grid)
+                for tx, tile_val in enumerate(row)
+                if tile_val in exit_values
+            ]
+            self._door_tiles_grid = grid
+        return self._door_tiles
+
+    def _current_exits(self) -> Dict[str, Dict[str, object]]:
+        """Return the current room's exits, fetched once per room."""
+        key = (self.current_level_id, self.current_room_code)
+        if key != self._exits_key:
+            self._exits = get_room_exits(self.current_level_id, self.current_room_code)
+            self._exits_key = key
+        return self._exits
+
     def handle_door_interaction(self, player_rect, tile_size: int, is_e_pressed: bool) -> Optional[Tuple[str, int, int]]:
         """Handle door interaction for the player.
         
@@ -75,7 +125,7 @@ class DoorSystem:
             
         # Get room exits
         try:
-            exits = get_room_exits(self.current_level_id, self.current_room_code)
+            exits = self._current_exits()
         except Exception as e:
             logger.error(f"Failed to get room exits: {e}")
             return None
@@ -89,30 +139,24 @@ class DoorSystem:
         
         # Search for door tiles near the player
         search_radius = tile_size * 2
-        door_found = False
         door_info = None
         
-        for ty, row in enumerate(self.current_tile_grid):
-            for tx, tile_val in enumerate(row):
-                if tile_val in (TileType.DOOR_EXIT_1.value, TileType.DOOR_EXIT_2.value):
-                    door_x = tx * tile_size + tile_size // 2
-                    door_y = ty * tile_size + tile_size // 2
+        for tx, ty, tile_val in self._exit_door_tiles():
+            door_x = tx * tile_size + tile_size // 2
+            door_y = ty * tile_size + tile_size // 2
+            
+            # Check distance to player
+            dist = ((player_center_x - door_x) ** 2 + (player_center_y - door_y) ** 2) ** 0.5
+            if dist <= search_radius:
+                # Determine which exit key this door corresponds to
+                if tile_val == TileType.DOOR_EXIT_1.value:
+                    exit_key = "door_exit_1"
+                    prompt_text = "Press E to enter (Exit 1)"
+                else:
+                    exit_key = "door_exit_2"
+                    prompt_text = "Press E to enter (Exit 2)"
                     
-                    # Check distance to player
-                    dist = ((player_center_x - door_x) ** 2 + (player_center_y - door_y) ** 2) ** 0.5
-                    if dist <= search_radius:
-                        door_found = True
-                        # Determine which exit key this door corresponds to
-                        if tile_val == TileType.DOOR_EXIT_1.value:
-                            exit_key = "door_exit_1"
-                            prompt_text = "Press E to enter (Exit 1)"
-                        else:
-                            exit_key = "door_exit_2"
-                            prompt_text = "Press E to enter (Exit 2)"
-                            
-                        door_info = (exit_key, prompt_text, door_x, door_y)
-                        break
-            if door_found:
+                door_info = (exit_key, prompt_text, door_x, door_y)
                 break
                 
         if not door_info:
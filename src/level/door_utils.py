@@ -1,66 +1,142 @@
 from typing import List, Optional, Tuple, Dict, Any
+from bisect import bisect_left
 import random
 from src.tiles.tile_types import TileType
-from src.level.pcg_level_data import RoomData
+from src.level.pcg_level_data import RoomData, placed_door_entry
 
+# Tile values recorded for placed door metadata
+_ENTRANCE_VALUE = TileType.DOOR_ENTRANCE.value
+_EXIT_1_VALUE = TileType.DOOR_EXIT_1.value
+_EXIT_2_VALUE = TileType.DOOR_EXIT_2.value
 
-def place_door(tile_grid: List[List[int]], tx: int, ty: int, door_type: TileType) -> None:
-    """Place a door tile (enum -> numeric) at tile coords (tx, ty)."""
+# Shared generator for callers that do not pass their own rng
+_FALLBACK_RNG = random.Random()
+
+
+def place_door(tile_grid: List[List[int]], tx: int, ty: int, door_type: TileType, cache: Optional[Dict[str, List[Tuple[int, int]]]] = None) -> None:
+    """Place a door tile (enum -> numeric) at tile coords (tx, ty).
+
+    Pass the same `cache` given to `choose_wall_position` so the wall
+    candidates next to the written tile are kept up to date.
+    """
     if not tile_grid:
         return
-    h = len(tile_grid)
-    w = len(tile_grid[0]) if h > 0 else 0
-    if ty < 0 or ty >= h:
+    if ty < 0 or ty >= len(tile_grid):
         return
-    if tx < 0 or tx >= w:
+    row = tile_grid[ty]
+    if tx < 0 or tx >= len(tile_grid[0]):
         return
-    tile_grid[ty][tx] = door_type.value
+    row[tx] = door_type.value
+    if cache:
+        _update_wall_candidates(cache, tile_grid, tx, ty)
 
 
-def choose_wall_position(tile_grid: List[List[int]], side: str = "left", rng: Optional[random.Random] = None) -> Optional[Tuple[int, int]]:
-    """Choose a safe tile on `side` wall. Prefers middle; falls back to random valid interior edge."""
-    rng = rng or random.Random()
-    if not tile_grid:
-        return None
+def _set_candidate(candidates: List[Tuple[int, int]], pos: Tuple[int, int], valid: bool) -> None:
+    """Add or remove `pos` in a sorted candidate list."""
+    i = bisect_left(candidates, pos)
+    present = i < len(candidates) and candidates[i] == pos
+    if valid and not present:
+        candidates.insert(i, pos)
+    elif present and not valid:
+        del candidates[i]
+
+
+def _update_wall_candidates(cache: Dict[str, List[Tuple[int, int]]], tile_grid: List[List[int]], tx: int, ty: int) -> None:
+    """Re-check only the wall candidates that depend on tile (tx, ty).
+
+    A candidate depends on its wall tile and the interior tile next to it,
+    so writes away from the walls leave the cache untouched. Lists stay in
+    `compute_wall_candidates` order.
+    """
     h = len(tile_grid)
+    w = len(tile_grid[0])
+    xr = w - 2
+    yb = h - 2
+    if 1 <= ty <= yb:
+        row = tile_grid[ty]
+        if tx == 1 or tx == 2:
+            _set_candidate(cache["left"], (1, ty), row[1] >= 0 and row[2] == 0)
+        if tx == xr or tx == xr - 1:
+            _set_candidate(cache["right"], (xr, ty), row[xr] >= 0 and row[xr - 1] == 0)
+    if 1 <= tx <= xr:
+        if ty == 1 or ty == 2:
+            _set_candidate(cache["top"], (tx, 1), tile_grid[1][tx] >= 0 and tile_grid[2][tx] == 0)
+        if ty == yb or ty == yb - 1:
+            _set_candidate(cache["bottom"], (tx, yb), tile_grid[yb][tx] >= 0 and tile_grid[yb - 1][tx] == 0)
+
+
+def compute_wall_candidates(tile_grid: List[List[int]]) -> Dict[str, List[Tuple[int, int]]]:
+    """Return safe door tiles for every wall side.
+
+    Keys are "left", "right", "top" and "bottom". Left and right come from
+    a single pass over the interior rows. Returns an empty dict for grids
+    smaller than 3x3.
+    """
+    h = len(tile_grid) if tile_grid else 0
     w = len(tile_grid[0]) if h > 0 else 0
     if w < 3 or h < 3:
-        return None
+        return {}
 
-    candidates: List[Tuple[int, int]] = []
-    if side == "left":
-        x = 1
-        for y in range(1, h - 1):
-            # Ensure adjacent interior tile is air (safe entry)
-            if tile_grid[y][x] >= 0 and tile_grid[y][x + 1] == 0:
-                candidates.append((x, y))
-    elif side == "right":
-        x = w - 2
-        for y in range(1, h - 1):
-            if tile_grid[y][x] >= 0 and tile_grid[y][x - 1] == 0:
-                candidates.append((x, y))
-    elif side == "top":
-        y = 1
-        for x in range(1, w - 1):
-            if tile_grid[y][x] >= 0 and tile_grid[y + 1][x] == 0:
-                candidates.append((x, y))
-    elif side == "bottom":
-        y = h - 2
-        for x in range(1, w - 1):
-            if tile_grid[y][x] >= 0 and tile_grid[y - 1][x] == 0:
-                candidates.append((x, y))
+    xr = w - 2
+    left: List[Tuple[int, int]] = []
+    right: List[Tuple[int, int]] = []
+    for y, row in enumerate(tile_grid[1:h - 1], 1):
+        # Ensure adjacent interior tile is air (safe entry)
+        if row[1] >= 0 and row[2] == 0:
+            left.append((1, y))
+        if row[xr] >= 0 and row[xr - 1] == 0:
+            right.append((xr, y))
 
-    if not candidates:
-        # fallback: any interior tile adjacent to either vertical walls (x==1 or x==w-2)
-        for y in range(1, h - 1):
-            for x in (1, w - 2):
-                if 0 <= x < w and tile_grid[y][x] == 0:
-                    candidates.append((x, y))
+    yb = h - 2
+    top = [(x, 1) for x, (v, below) in enumerate(zip(tile_grid[1][1:w - 1], tile_grid[2][1:w - 1]), 1)
+           if v >= 0 and below == 0]
+    bottom = [(x, yb) for x, (v, above) in enumerate(zip(tile_grid[yb][1:w - 1], tile_grid[yb - 1][1:w - 1]), 1)
+              if v >= 0 and above == 0]
+    return {"left": left, "right": right, "top": top, "bottom": bottom}
 
-    if not candidates:
+
+def _scan_fallback(tile_grid: List[List[int]], rng: random.Random) -> Optional[Tuple[int, int]]:
+    """Return a uniformly random air tile on the vertical walls (x==1 or x==w-2).
+
+    Slots are visited in a lazily shuffled order (Fisher-Yates, one swap per
+    visit), so the scan stops at the first hit instead of collecting every
+    candidate, and each air tile is equally likely to be that hit.
+    """
+    xr = len(tile_grid[0]) - 2
+    slots = list(range(2 * (len(tile_grid) - 2)))
+    for n in range(len(slots), 0, -1):
+        i = rng.randrange(n)
+        k = slots[i]
+        slots[i] = slots[n - 1]
+        x = xr if k & 1 else 1
+        y = 1 + (k >> 1)
+        if tile_grid[y][x] == 0:
+            return (x, y)
+    return None
+
+
+def choose_wall_position(tile_grid: List[List[int]], side: str = "left", rng: Optional[random.Random] = None, cache: Optional[Dict[str, List[Tuple[int, int]]]] = None) -> Optional[Tuple[int, int]]:
+    """Choose a random safe tile on `side` wall; falls back to a random valid interior edge.
+
+    When choosing several doors for one room, pass `room._wall_candidates`
+    as `cache` so the candidates for all sides are computed once; give the
+    same dict to `place_door` so its writes update them.
+    """
+    rng = rng or _FALLBACK_RNG
+    if not tile_grid:
         return None
-    # Prefer the middle candidate if present
-    mid = len(candidates) // 2
+    if cache is None:
+        sides = compute_wall_candidates(tile_grid)
+    else:
+        if not cache:
+            cache.update(compute_wall_candidates(tile_grid))
+        sides = cache
+    if not sides:
+        return None
+
+    candidates = sides.get(side)
+    if not candidates:
+        return _scan_fallback(tile_grid, rng)
     return rng.choice(candidates) if len(candidates) > 1 else candidates[0]
 
 
@@ -80,22 +156,14 @@ def place_exit_with_metadata(
     that expect metadata updates to function without introducing legacy fixed
     position tile writes that interfere with PCG.
     """
-    if getattr(room, "door_exits", None) is None:
-        room.door_exits = {}
     room.door_exits[exit_key] = target
 
-    room.placed_doors = getattr(room, "placed_doors", []) or []
     # Avoid duplicate entries
     if not any(d.get('exit_key') == exit_key for d in room.placed_doors):
-        door_tile_value = TileType.DOOR_EXIT_1.value if exit_key == "door_exit_1" else TileType.DOOR_EXIT_2.value
-        room.placed_doors.append({
-            "tx": tx,
-            "ty": ty,
-            "tile": door_tile_value,
-            "role": "exit",
-            "exit_key": exit_key,
-            "target": target,
-        })
+        room.placed_doors.append(placed_door_entry(
+            tx, ty, _EXIT_1_VALUE if exit_key == "door_exit_1" else _EXIT_2_VALUE, "exit",
+            exit_key=exit_key, target=target,
+        ))
 
 
 def place_entrance(room: RoomData, tile_grid: List[List[int]], tx: int, ty: int, entrance_from: Optional[str]) -> None:
@@ -106,12 +174,5 @@ def place_entrance(room: RoomData, tile_grid: List[List[int]], tx: int, ty: int,
     door_placement to write tiles.
     """
     room.entrance_from = entrance_from
-    room.placed_doors = getattr(room, "placed_doors", []) or []
     if not any(d.get('role') == 'entrance' for d in room.placed_doors):
-        room.placed_doors.append({
-            "tx": tx,
-            "ty": ty,
-            "tile": TileType.DOOR_ENTRANCE.value,
-            "role": "entrance",
-            "source": entrance_from,
-        })
+        room.placed_doors.append(placed_door_entry(tx, ty, _ENTRANCE_VALUE, "entrance", source=entrance_from))
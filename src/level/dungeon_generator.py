@@ -3,6 +3,7 @@ Seed-based random dungeon generator for 2D action game.
 Generates deterministic dungeons with rooms, corridors, and monster placements.
 """
 
+import heapq
 import random
 import pygame
 from enum import Enum
@@ -28,6 +29,8 @@ class Room:
     """Represents a room in the dungeon."""
     def __init__(self, rect: pygame.Rect, is_start: bool = False, is_boss: bool = False):
         self.rect = rect
+        # Rooms are never moved after creation, so the center is fixed
+        self.center: Tuple[int, int] = rect.center
         self.is_start = is_start
         self.is_boss = is_boss
         self.monsters: List[MonsterSpawn] = []
@@ -72,7 +75,7 @@ def generate_dungeon(stage_index: int, seed: int,
     rng = random.Random(seed + stage_index * 1000)
     
     # Step 1: Initialize tiles as all WALL
-    tiles = [[TileType.WALL for _ in range(width)] for _ in range(height)]
+    tiles = [[TileType.WALL] * width for _ in range(height)]
     
     # Step 2: Carve out rooms
     rooms = _generate_rooms(tiles, width, height, rng, num_rooms=rng.randint(6, 10))
@@ -152,10 +155,19 @@ def _generate_rooms(tiles: List[List[TileType]], width: int, height: int,
 
 def _carve_room(tiles: List[List[TileType]], rect: pygame.Rect) -> None:
     """Carve out a rectangular room in the tiles."""
-    for y in range(rect.top, rect.bottom):
-        for x in range(rect.left, rect.right):
-            if 0 <= y < len(tiles) and 0 <= x < len(tiles[0]):
-                tiles[y][x] = TileType.FLOOR
+    for y in range(max(0, rect.top), min(len(tiles), rect.bottom)):
+        _carve_row_span(tiles, y, rect.left, rect.right - 1)
+
+
+def _carve_row_span(tiles: List[List[TileType]], y: int, x0: int, x1: int) -> None:
+    """Carve floor on row `y` from `x0` to `x1` inclusive, clipped to the map."""
+    if not 0 <= y < len(tiles):
+        return
+    row = tiles[y]
+    start = max(0, x0)
+    end = min(len(tiles[0]), x1 + 1)
+    if start < end:
+        row[start:end] = [TileType.FLOOR] * (end - start)
 
 
 def _connect_rooms(tiles: List[List[TileType]], rooms: List[Room], rng: random.Random) -> None:
@@ -163,7 +175,7 @@ def _connect_rooms(tiles: List[List[TileType]], rooms: List[Room], rng: random.R
     for i in range(len(rooms) - 1):
         room_a = rooms[i]
         room_b = rooms[i + 1]
-        _carve_corridor(tiles, room_a.rect.center, room_b.rect.center, rng)
+        _carve_corridor(tiles, room_a.center, room_b.center, rng)
     
     # Add some extra connections for variety
     extra_connections = len(rooms) // 3
@@ -171,7 +183,7 @@ def _connect_rooms(tiles: List[List[TileType]], rooms: List[Room], rng: random.R
         room_a = rng.choice(rooms)
         room_b = rng.choice(rooms)
         if room_a != room_b:
-            _carve_corridor(tiles, room_a.rect.center, room_b.rect.center, rng)
+            _carve_corridor(tiles, room_a.center, room_b.center, rng)
 
 
 def _carve_corridor(tiles: List[List[TileType]], start: Tuple[int, int], 
@@ -183,9 +195,7 @@ def _carve_corridor(tiles: List[List[TileType]], start: Tuple[int, int],
     # Randomly choose horizontal-then-vertical or vertical-then-horizontal
     if rng.random() < 0.5:
         # Horizontal then vertical
-        for x in range(min(x1, x2), max(x1, x2) + 1):
-            if 0 <= y1 < len(tiles) and 0 <= x < len(tiles[0]):
-                tiles[y1][x] = TileType.FLOOR
+        _carve_row_span(tiles, y1, min(x1, x2), max(x1, x2))
         for y in range(min(y1, y2), max(y1, y2) + 1):
             if 0 <= y < len(tiles) and 0 <= x2 < len(tiles[0]):
                 tiles[y][x2] = TileType.FLOOR
@@ -194,28 +204,27 @@ def _carve_corridor(tiles: List[List[TileType]], start: Tuple[int, int],
         for y in range(min(y1, y2), max(y1, y2) + 1):
             if 0 <= y < len(tiles) and 0 <= x1 < len(tiles[0]):
                 tiles[y][x1] = TileType.FLOOR
-        for x in range(min(x1, x2), max(x1, x2) + 1):
-            if 0 <= y2 < len(tiles) and 0 <= x < len(tiles[0]):
-                tiles[y2][x] = TileType.FLOOR
+        _carve_row_span(tiles, y2, min(x1, x2), max(x1, x2))
 
 
 def _pick_furthest_room(rooms: List[Room], start_room: Room, rng: random.Random) -> Room:
     """Pick a room that is far from the start room."""
-    start_center = start_room.rect.center
+    sx, sy = start_room.center
     
     # Calculate distances
     distances = []
     for room in rooms:
         if room == start_room:
             continue
-        dx = room.rect.centerx - start_center[0]
-        dy = room.rect.centery - start_center[1]
-        dist = (dx * dx + dy * dy) ** 0.5
-        distances.append((dist, room))
+        cx, cy = room.center
+        dx = cx - sx
+        dy = cy - sy
+        # Squared distance orders rooms the same as the Euclidean one
+        distances.append((dx * dx + dy * dy, room))
     
-    # Sort by distance and pick from the furthest quarter
-    distances.sort(reverse=True)
-    furthest_quarter = distances[:max(1, len(distances) // 4)]
+    # Pick from the furthest quarter (ties keep room order); nlargest matches
+    # a stable descending sort without ordering the rest of the list
+    furthest_quarter = heapq.nlargest(max(1, len(distances) // 4), distances, key=lambda d: d[0])
     
     return rng.choice(furthest_quarter)[1]
 
@@ -226,36 +235,51 @@ def _flood_fill_reachable_rooms(tiles: List[List[TileType]], rooms: List[Room],
     height = len(tiles)
     width = len(tiles[0]) if height > 0 else 0
     
-    visited = set()
-    queue = [start_room.rect.center]
-    visited.add(start_room.rect.center)
+    floor = TileType.FLOOR
+    # One bytearray per row marks visited tiles; no (x, y) tuples are hashed
+    visited = [bytearray(width) for _ in range(height)]
+    # Pending seeds; fill order does not matter, so a plain list stack will do
+    stack = [start_room.center]
     
-    # Flood fill all connected floor tiles
-    while queue:
-        x, y = queue.pop(0)
+    # Scanline flood fill: each seed claims its whole horizontal floor run,
+    # then seeds the first tile of every floor run touching it above/below
+    while stack:
+        x, y = stack.pop()
+        seen = visited[y]
+        if seen[x]:
+            continue
+        row = tiles[y]
+        left = x
+        while left > 0 and row[left - 1] == floor:
+            left -= 1
+        right = x
+        while right < width - 1 and row[right + 1] == floor:
+            right += 1
+        seen[left:right + 1] = b"\x01" * (right + 1 - left)
         
-        for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-            nx, ny = x + dx, y + dy
-            
-            if (0 <= nx < width and 0 <= ny < height and 
-                (nx, ny) not in visited and tiles[ny][nx] == TileType.FLOOR):
-                visited.add((nx, ny))
-                queue.append((nx, ny))
+        for ny in (y - 1, y + 1):
+            if not 0 <= ny < height:
+                continue
+            nrow = tiles[ny]
+            nseen = visited[ny]
+            in_run = False
+            for nx in range(left, right + 1):
+                if nrow[nx] == floor:
+                    if not in_run and not nseen[nx]:
+                        stack.append((nx, ny))
+                    in_run = True
+                else:
+                    in_run = False
     
-    # Check which rooms contain visited tiles
+    # A room is reachable if any tile inside its rect was visited
     reachable_rooms = []
     for room in rooms:
-        # Check if any tile in the room was visited
-        room_reachable = False
-        for y in range(room.rect.top, room.rect.bottom):
-            for x in range(room.rect.left, room.rect.right):
-                if (x, y) in visited:
-                    room_reachable = True
-                    break
-            if room_reachable:
-                break
-        
-        if room_reachable:
+        left = max(0, room.rect.left)
+        right = min(width, room.rect.right)
+        if left < right and any(
+            any(visited[y][left:right])
+            for y in range(max(0, room.rect.top), min(height, room.rect.bottom))
+        ):
             reachable_rooms.append(room)
     
     return reachable_rooms
@@ -264,7 +288,7 @@ def _flood_fill_reachable_rooms(tiles: List[List[TileType]], rooms: List[Room],
 def _force_connect_room(tiles: List[List[TileType]], start_room: Room, 
                        target_room: Room, rng: random.Random) -> None:
     """Force a corridor connection between two rooms."""
-    _carve_corridor(tiles, start_room.rect.center, target_room.rect.center, rng)
+    _carve_corridor(tiles, start_room.center, target_room.center, rng)
 
 
 def _spawn_monsters(rooms: List[Room], stage_index: int, boss_room: Room, 
@@ -7,13 +7,45 @@ The legacy system uses hardcoded ASCII room definitions with entity markers.
 This is kept for backward compatibility and can be accessed via menu toggle.
 """
 
+import math
 import pygame
+from array import array
 from src.core.utils import resource_path
 from typing import List, Optional
 from config import TILE, CYAN, WIDTH, HEIGHT
 from ..entities.entities import Bug, Boss, Frog, Archer, WizardCaster, Assassin, Bee, Golem, KnightMonster
-from ..tiles import TileParser, TileRenderer, TileRegistry, TileType
+from ..tiles import TileParser, TileRenderer, TileType
 from ..tiles.tile_collision import TileCollision
+from ..tiles.tile_registry import tile_registry
+
+# Tile data per raw grid value, resolved once from the shared registry
+_TILE_DATA_BY_VALUE = {tile_type.value: tile_registry.get_tile(tile_type) for tile_type in TileType}
+# Values whose tiles are collision solids, and values a spawn can stand on
+_SOLID_VALUES = frozenset(
+    value for value, tile_data in _TILE_DATA_BY_VALUE.items()
+    if tile_data and tile_data.collision.collision_type == "full"
+)
+_GROUND_VALUES = frozenset(
+    value for value, tile_data in _TILE_DATA_BY_VALUE.items()
+    if value and tile_data and tile_data.collision.collision_type != "none"
+)
+# Raw cell byte -> 1 for solid tiles, for masking a whole grid row at once
+_SOLID_TABLE = bytes(1 if value in _SOLID_VALUES else 0 for value in range(256))
+
+# Enemy class spawned for each legacy enemy marker
+_ENEMY_FACTORY = {
+    'enemy': Bug,
+    'enemy_fast': Frog,
+    'enemy_ranged': Archer,
+    'enemy_wizard': WizardCaster,
+    'enemy_armor': Assassin,
+    'enemy_bee': Bee,
+    'enemy_knight': Golem,
+    'enemy_boss': KnightMonster,
+}
+
+# Color keyed out of pre-rendered room tiles; tile sprites never use it
+_BACKGROUND_KEY = (255, 0, 255)
 
 # Rooms (tilemaps). Legend:
 #   Tiles: # wall, . air/empty, _ platform, @ breakable wall, % breakable floor
@@ -152,6 +184,30 @@ ROOMS = [
 # Useful constant for other modules (eg. Game.switch_room)
 ROOM_COUNT = len(ROOMS)
 
+# Tile systems shared by every legacy level. None of them hold per-room state, so
+# room switches reuse their tables and the renderer's scaled tile sprites
+_TILE_PARSER = TileParser()
+_TILE_RENDERER = TileRenderer(TILE)
+_TILE_COLLISION = TileCollision(TILE)
+
+
+def _parse_room(raw: List[str]):
+    """Parse one ASCII room into frozen (grid rows, entity positions)."""
+    grid, entity_positions = _TILE_PARSER.parse_ascii_level(raw, legacy=True)
+    return (
+        tuple(tuple(row) for row in grid),
+        {entity_type: tuple(positions) for entity_type, positions in entity_positions.items()},
+    )
+
+
+# Every static room parsed once at import. Levels copy the grid rows they own,
+# so entering a room never re-runs the ASCII parser.
+_PARSED_ROOMS = [_parse_room(raw) for raw in ROOMS]
+
+# Collision solids (and per-row solid bitmasks) of each untouched static room, keyed
+# by room index. ROOMS never change, so they are built once and reused on re-entry.
+_STATIC_SOLIDS_CACHE = {}
+
 
 class LegacyLevel:
     """
@@ -170,15 +226,21 @@ class LegacyLevel:
         """
         # Core containers
         self.solids: List[pygame.Rect] = []
+        # Bit x of entry y is set when grid cell (x, y) is a solid
+        self._solid_rowmask: List[int] = []
         self.enemies: List[object] = []  # Can contain any enemy type
         self.doors: List[pygame.Rect] = []
         self.spawn = (TILE * 2, TILE * 2)
 
+        # Room tiles pre-rendered as (zoom, surface), and the zoom of the last draw
+        self._background = None
+        self._last_draw_zoom = None
+
         # Initialize tile/physics systems
-        self.tile_parser = TileParser()
-        self.tile_renderer = TileRenderer(TILE)
-        self.tile_registry = TileRegistry()
-        self.tile_collision = TileCollision(TILE)
+        self.tile_parser = _TILE_PARSER
+        self.tile_renderer = _TILE_RENDERER
+        self.tile_registry = tile_registry
+        self.tile_collision = _TILE_COLLISION
 
         # --- Load Portal Sprite (NEW) ---
         try:
@@ -203,22 +265,22 @@ class LegacyLevel:
     
     def _init_from_ascii(self) -> None:
         """
-        Initialize level state from ASCII ROOMS using TileParser.
+        Initialize level state from the ASCII ROOMS parsed at import.
         """
-        # Get ASCII room definition
-        raw = ROOMS[self.index]
-
-        # Parse ASCII as legacy
-        self.grid, entity_positions = self.tile_parser.parse_ascii_level(
-            raw,
-            legacy=True,
-        )
+        grid, entity_positions = _PARSED_ROOMS[self.index]
+        # Copy each frozen row into a compact signed-byte array; rows still index like lists
+        self.grid = [array('b', row) for row in grid]
 
         # Load entities/doors from parsed markers
         self._load_entities(entity_positions)
 
-        # Build solids from tile collision data
-        self._update_solids_from_grid()
+        # Build solids from tile collision data (once per static room)
+        cached = _STATIC_SOLIDS_CACHE.get(self.index)
+        if cached is None:
+            self._update_solids_from_grid()
+            _STATIC_SOLIDS_CACHE[self.index] = (self.solids, self._solid_rowmask)
+        solids, self._solid_rowmask = _STATIC_SOLIDS_CACHE[self.index]
+        self.solids = list(solids)
 
     def _load_entities(self, entity_positions: dict):
         """
@@ -236,65 +298,58 @@ class LegacyLevel:
                 raw_spawn = (x * TILE, y * TILE)
                 self.spawn = raw_spawn
 
-        # Load enemies from legacy markers
+        # Load enemies and doors from legacy markers, one batch per marker type
         for entity_type, positions in entity_positions.items():
-            for x, y in positions:
-                world_x = x * TILE
-                world_y = y * TILE
-                rect = pygame.Rect(world_x, world_y, TILE, TILE)
-
-                # Skip regular enemies in boss rooms (but allow doors and boss)
-                if boss_present and entity_type != 'enemy_boss' and entity_type != 'door':
-                    continue
-
-                if entity_type == 'enemy':
-                    self.enemies.append(Bug(rect.centerx, rect.bottom))
-                elif entity_type == 'enemy_fast':
-                    self.enemies.append(Frog(rect.centerx, rect.bottom))
-                elif entity_type == 'enemy_ranged':
-                    self.enemies.append(Archer(rect.centerx, rect.bottom))
-                elif entity_type == 'enemy_wizard':
-                    self.enemies.append(WizardCaster(rect.centerx, rect.bottom))
-                elif entity_type == 'enemy_armor':
-                    self.enemies.append(Assassin(rect.centerx, rect.bottom))
-                elif entity_type == 'enemy_bee':
-                    self.enemies.append(Bee(rect.centerx, rect.bottom))
-                elif entity_type == 'enemy_knight':
-                    self.enemies.append(Golem(rect.centerx, rect.bottom))
-                elif entity_type == 'enemy_boss':
-                    self.enemies.append(KnightMonster(rect.centerx, rect.bottom))
-                elif entity_type == 'door':
-                    self.doors.append(rect)
+            if entity_type == 'door':
+                self.doors.extend(pygame.Rect(x * TILE, y * TILE, TILE, TILE) for x, y in positions)
+                continue
+
+            enemy_cls = _ENEMY_FACTORY.get(entity_type)
+            # Skip regular enemies in boss rooms (but allow doors and boss)
+            if enemy_cls is None or (boss_present and entity_type != 'enemy_boss'):
+                continue
+            # Enemies stand centered on the marker tile with their feet on its bottom edge
+            self.enemies.extend(enemy_cls(x * TILE + TILE // 2, (y + 1) * TILE) for x, y in positions)
 
     def _update_solids_from_grid(self):
         """Update solids list from tile grid."""
-        self.solids = []
+        # Mask each row in one translate and jump between solid cells with find
+        xs_px: List[int] = []
+        ys_px: List[int] = []
+        rowmask: List[int] = []
         for y, row in enumerate(self.grid):
-            for x, tile_value in enumerate(row):
-                if tile_value >= 0:
-                    from ..tiles import TileType
-                    tile_type = TileType(tile_value)
-                    tile_data = self.tile_registry.get_tile(tile_type)
-
-                    # Add solids for tiles with full collision
-                    if tile_data and tile_data.collision.collision_type == "full":
-                        rect = pygame.Rect(x * TILE, y * TILE, TILE, TILE)
-                        self.solids.append(rect)
+            mask = row.tobytes().translate(_SOLID_TABLE)
+            bits = 0
+            x = mask.find(1)
+            while x != -1:
+                xs_px.append(x * TILE)
+                ys_px.append(y * TILE)
+                bits |= 1 << x
+                x = mask.find(1, x + 1)
+            rowmask.append(bits)
+        sizes = [TILE] * len(xs_px)
+        self.solids = list(map(pygame.Rect, xs_px, ys_px, sizes, sizes))
+        self._solid_rowmask = rowmask
 
     def _validate_spawn_position(self, spawn_pos):
         """Validate and adjust spawn position to prevent spawning inside walls."""
         x, y = spawn_pos
         player_rect = pygame.Rect(x, y, 18, 30)  # Player dimensions: 18x30
 
-        # Check if spawn position is inside a solid tile
-        tiles_in_rect = self.tile_collision.get_tiles_in_rect(player_rect, self.grid)
-        for tile_type, tile_x, tile_y in tiles_in_rect:
-            tile_data = self.tile_registry.get_tile(tile_type)
-            if tile_data and tile_data.collision.collision_type == "full":
-                # Spawn position is inside a solid tile, find a better position
-                # Try to spawn above this tile (not below - we want player standing on top)
-                new_y = tile_y * TILE - 30  # Player's top at tile_y * TILE - player_height
-                return (x, new_y)
+        # Check if spawn position is inside a solid tile; each covered row is tested
+        # with one AND of its solid bitmask against the covered column span
+        start_x = max(0, int(player_rect.left // TILE))
+        end_x = min(len(self.grid[0]) if self.grid else 0, int(player_rect.right // TILE) + 1)
+        start_ty = max(0, int(player_rect.top // TILE))
+        end_ty = min(len(self.grid), int(player_rect.bottom // TILE) + 1)
+        if start_x < end_x:
+            span = (1 << end_x) - (1 << start_x)
+            for tile_y in range(start_ty, end_ty):
+                if self._solid_rowmask[tile_y] & span:
+                    # Spawn position is inside a solid tile, find a better position
+                    # Try to spawn above this tile (not below - we want player standing on top)
+                    new_y = tile_y * TILE - 30  # Player's top at tile_y * TILE - player_height
+                    return (x, new_y)
 
         # Also check if there's a solid tile directly below player's feet
         feet_y = y + 30
@@ -305,14 +360,15 @@ class LegacyLevel:
                 # Player is on solid ground, this spawn is valid
                 return (x, y)
 
-        # If no solid ground below, try to find the nearest solid ground below
-        for check_y in range(int(feet_y), self.h, TILE):
-            tile_at_y = self.tile_collision.get_tile_at_pos(x + 9, check_y, self.grid)
-            if tile_at_y:
-                tile_data = self.tile_registry.get_tile(tile_at_y)
-                if tile_data and tile_data.collision.collision_type != "none":
+        # If no solid ground below, scan down the feet column for the nearest solid ground
+        start_y = int(feet_y)
+        start_row = start_y // TILE
+        col = int((x + 9) // TILE)
+        if self.grid and 0 <= col < len(self.grid[0]):
+            for row in range(max(start_row, 0), len(self.grid)):
+                if self.grid[row][col] in _GROUND_VALUES:
                     # Found solid ground, adjust spawn position
-                    new_y = check_y - 30
+                    new_y = start_y + (row - start_row) * TILE - 30
                     return (x, new_y)
 
         # If no solid ground found, return original position
@@ -329,28 +385,64 @@ class LegacyLevel:
         if 0 <= y < len(self.grid) and 0 <= x < len(self.grid[0]):
             self.grid[y][x] = tile_value
             self._update_solids_from_grid()
+            # The pre-rendered tiles no longer match the grid
+            self._background = None
+
+    def _background_for_zoom(self, zoom: float) -> Optional[pygame.Surface]:
+        """Return the room's tiles pre-rendered at `zoom`, or None when they must be drawn per tile.
+
+        A single blit only lines up with the per-tile `int((x - cam) * zoom)` rounding used
+        for entities and doors when the scaled tile size is whole (zoom 1.0 and 1.5, not 1.2).
+        """
+        if not (TILE * zoom).is_integer():
+            return None
+        if self._background is not None and self._background[0] == zoom:
+            return self._background[1]
+        settled = zoom == self._last_draw_zoom
+        self._last_draw_zoom = zoom
+        if not settled:
+            return None
+
+        # One spare tile of margin covers rounding of the scaled tile positions
+        size = (int(self.w * zoom) + TILE, int(self.h * zoom) + TILE)
+        tiles = pygame.Surface(size, pygame.SRCALPHA)
+        self.tile_renderer.render_tile_grid(tiles, self.grid, (0, 0), tiles.get_rect(), zoom=zoom)
+        # Tile pixels are either opaque or fully clear, so an opaque copy with the clear
+        # parts color-keyed draws the same and blits far faster than per-pixel alpha
+        background = pygame.Surface(size)
+        background.fill(_BACKGROUND_KEY)
+        background.blit(tiles, (0, 0))
+        background.set_colorkey(_BACKGROUND_KEY, pygame.RLEACCEL)
+        self._background = (zoom, background)
+        return background
 
     def draw(self, surf, camera):
-        # Draw tiles using the new tile renderer
-        camera_offset = (camera.x, camera.y)
-        # visible_rect should be screen coordinates in pixels, not world coords
-        visible_rect = pygame.Rect(0, 0, WIDTH, HEIGHT)
-        self.tile_renderer.render_tile_grid(surf, self.grid, camera_offset, visible_rect, zoom=camera.zoom)
+        background = self._background_for_zoom(camera.zoom)
+        if background is not None:
+            # Static tiles are drawn once per zoom; a single blit places the visible part
+            surf.blit(background, (-math.ceil(camera.x * camera.zoom), -math.ceil(camera.y * camera.zoom)))
+        else:
+            # Draw tiles using the new tile renderer
+            camera_offset = (camera.x, camera.y)
+            # visible_rect should be screen coordinates in pixels, not world coords
+            visible_rect = pygame.Rect(0, 0, WIDTH, HEIGHT)
+            self.tile_renderer.render_tile_grid(surf, self.grid, camera_offset, visible_rect, zoom=camera.zoom)
 
-        # Draw doors (over tiles)
+        # Locked (red) if boss room and boss still alive; the same for every door this frame
+        locked = getattr(self, 'is_boss_room', False) and any(getattr(e, 'alive', False) for e in self.enemies)
+        col = (200, 80, 80) if locked else CYAN
+
+        # Draw doors (over tiles); the portal sprite's centering offset is the same for every door
+        img = self.portal_image
+        if img:
+            half_w = img.get_width() // 2
+            half_h = img.get_height() // 2
         for d in self.doors:
-            # Locked (red) if boss room and boss still alive
-            locked = getattr(self, 'is_boss_room', False) and any(getattr(e, 'alive', False) for e in self.enemies)
-            col = (200, 80, 80) if locked else CYAN
-            
             # --- Draw Doors using Portal Sprite ---
             screen_rect = camera.to_screen_rect(d)
-            if self.portal_image:
-                img = self.portal_image
+            if img:
                 # Center sprite on tile (Hitbox 32x32)
-                draw_x = screen_rect.centerx - img.get_width() // 2
-                draw_y = screen_rect.centery - img.get_height() // 2
-                surf.blit(img, (draw_x, draw_y))
+                surf.blit(img, (screen_rect.centerx - half_w, screen_rect.centery - half_h))
             else:
                 # Fallback to colored rectangle if portal image fails to load
                 pygame.draw.rect(surf, col, screen_rect, width=2)
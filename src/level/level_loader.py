@@ -4,13 +4,17 @@ import os
 from typing import Optional, List, Dict
 import sys
 
-# Add project root to path for imports
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+# Ensure project root is on path when running this module directly
+if __name__ == "__main__":
+    sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from src.level.pcg_level_data import LevelSet, LevelData, RoomData, AreaRegion, AreaRect, room_areas_from_raw, build_tile_region_map, expand_rects_to_tiles, top_region_for_tile
 from typing import Tuple, Callable
 import random
 
+# Shared generator for callers that do not pass their own rng
+_FALLBACK_RNG = random.Random()
+
 
 class LevelLoader:
     """Utility class for loading and accessing PCG-generated levels."""
@@ -40,7 +44,7 @@ class LevelLoader:
         try:
             for level in self._level_set.levels:
                 for room in level.rooms:
-                    areas = getattr(room, 'areas', []) or []
+                    areas = room.areas
                     for a in areas:
                         try:
                             if not isinstance(a, dict):
@@ -214,22 +218,37 @@ class LevelLoader:
         return None
 
     # ----- Area / Region helpers -----
+    @staticmethod
+    def _room_regions(room: RoomData) -> List[AreaRegion]:
+        """Return the room's areas as AreaRegion objects, converted once.
+
+        The result is cached on the room and rebuilt when `room.areas` is
+        replaced or changes length; callers must not mutate it.
+        """
+        areas = room.areas
+        cached = getattr(room, '_regions_cache', None)
+        if cached is not None and cached[0] is areas and cached[1] == len(areas):
+            return cached[2]
+        regions = room_areas_from_raw(areas)
+        room._regions_cache = (areas, len(areas), regions)
+        return regions
+
     def get_room_areas(self, level_id: int, room_code: str) -> List[AreaRegion]:
         """Return list of AreaRegion for a room (converts raw dicts to objects)."""
         room = self.get_room(level_id, room_code)
         if not room:
             return []
-        raw = getattr(room, "areas", None)
-        return room_areas_from_raw(raw)
+        return list(self._room_regions(room))
 
     def find_regions_by_kind(self, level_id: int, room_code: str, kind: str) -> List[AreaRegion]:
         return [r for r in self.get_room_areas(level_id, room_code) if r.kind == kind]
 
     def build_room_tile_region_map(self, level_id: int, room_code: str) -> Dict[Tuple[int,int], List[AreaRegion]]:
-        regions = self.get_room_areas(level_id, room_code)
+        # One room lookup serves both the regions and the grid size
         room = self.get_room(level_id, room_code)
         if not room:
             return {}
+        regions = self._room_regions(room)
         # width = number of columns (x), height = number of rows (y)
         height = len(room.tiles) if room.tiles else 0
         width = len(room.tiles[0]) if height > 0 else 0
@@ -260,7 +279,7 @@ class LevelLoader:
         - `avoid_positions` is a list of tile positions to avoid (e.g., player).
         - `min_distance` is Euclidean minimum distance in tiles to any avoid position.
         """
-        rng = rng or random.Random()
+        rng = rng or _FALLBACK_RNG
         regions = self.find_regions_by_kind(level_id, room_code, kind)
         if not regions:
             return None
@@ -277,8 +296,12 @@ class LevelLoader:
             weighted.append((r, weight))
         if not weighted:
             return None
-        # Build weighted per-tile candidate list from all allowed regions
-        tile_candidates: List[Tuple[Tuple[int,int], float, AreaRegion]] = []  # ((x,y), weight, region)
+        # Weight each region tile and filter it in the same pass, building the
+        # final weighted list (and its running total) without an intermediate
+        # candidate list
+        min_dist_sq = min_distance * min_distance
+        final_tiles: List[Tuple[Tuple[int,int], float]] = []
+        total = 0.0
         for r, rwgt in weighted:
             rect_tiles = expand_rects_to_tiles(r.rects)
             if not rect_tiles:
@@ -294,44 +317,37 @@ class LevelLoader:
                 cnt = 1
             center = (cx_sum / cnt, cy_sum / cnt)
 
-            # assign per-tile weight with mild bias toward center (not squared distance)
-            # Use linear distance instead of squared to reduce clustering
             for (tx, ty) in rect_tiles:
+                # filter by walkable_check and avoid_positions
+                if walkable_check and not walkable_check(tx, ty):
+                    continue
+                if avoid_positions:
+                    bad = False
+                    for ax, ay in avoid_positions:
+                        dx = ax - tx
+                        dy = ay - ty
+                        if dx * dx + dy * dy <= min_dist_sq:
+                            bad = True
+                            break
+                    if bad:
+                        continue
+                # assign per-tile weight with mild bias toward center (not squared distance)
+                # Use linear distance instead of squared to reduce clustering
                 dx = (tx + 0.5) - center[0]
                 dy = (ty + 0.5) - center[1]
                 dist = (dx * dx + dy * dy) ** 0.5  # Linear distance, not squared
                 # Reduce center bias: use larger constant and smaller divisor
-                tile_weight = rwgt / (5.0 + dist * 0.5)  # Much less biased toward center
-                tile_candidates.append(((tx, ty), float(tile_weight), r))
+                tile_weight = float(rwgt / (5.0 + dist * 0.5))  # Much less biased toward center
+                final_tiles.append(((tx, ty), tile_weight))
+                total += tile_weight
 
-        if not tile_candidates:
-            return None
-
-        # optionally shuffle to add randomness for equal weights
-        rng.shuffle(tile_candidates)
-
-        # filter by walkable_check and avoid_positions, build final weighted list
-        final_tiles: List[Tuple[Tuple[int,int], float]] = []
-        for (tx, ty), tw, reg in tile_candidates:
-            if walkable_check and not walkable_check(tx, ty):
-                continue
-            if avoid_positions:
-                bad = False
-                for ax, ay in avoid_positions:
-                    dx = ax - tx
-                    dy = ay - ty
-                    if dx * dx + dy * dy <= min_distance * min_distance:
-                        bad = True
-                        break
-                if bad:
-                    continue
-            final_tiles.append(((tx, ty), tw))
+        # No shuffle needed: the cumulative-weight pick below selects each
+        # tile with probability weight / total regardless of list order.
 
         if not final_tiles:
             return None
 
         # sample a tile by weight
-        total = sum(w for _, w in final_tiles)
         pick = rng.random() * total
         upto = 0.0
         for (tx, ty), w in final_tiles:
@@ -23,7 +23,9 @@ manages logical connectivity via door_exits and entrance_from.
 
 from __future__ import annotations
 
+import logging
 import random
+from bisect import bisect_left
 from typing import List, Dict, Optional, Tuple, Set
 import os
 import sys
@@ -38,8 +40,14 @@ from src.level.pcg_level_data import (
     RoomData,
     LevelData,
     LevelSet,
+    generate_room_tiles,
 )
 
+logger = logging.getLogger(__name__)
+
+# Shared generator for callers that do not pass their own rng
+_FALLBACK_RNG = random.Random()
+
 
 # ----- Quadrant System for Door Placement -----
 
@@ -102,7 +110,7 @@ def get_random_position_in_quadrant(quadrant: Tuple[int, int, int, int], carve_s
         (x, y) position for top-left of carve area, or None if no space
     """
     if rng is None:
-        rng = random.Random()
+        rng = _FALLBACK_RNG
     
     qx, qy, qw, qh = quadrant
     
@@ -133,7 +141,6 @@ def generate_simple_room_tiles(config: PCGConfig) -> List[List[int]]:
 
     Uses tile IDs from PCGConfig (loaded from config/pcg_config.json).
     """
-    from src.level.pcg_level_data import generate_room_tiles
     # Delegate to helper to keep generation logic centralized
     return generate_room_tiles(
         level_id=1, room_index=0, room_letter="A",
@@ -166,7 +173,6 @@ def generate_rooms_for_level(
         for letter in letters:
             room_code = f"{level_id}{slot}{letter}"
             # Generate tiles using the centralized helper so room tiles vary by room
-            from src.level.pcg_level_data import generate_room_tiles
             tiles = generate_room_tiles(
                 level_id=level_id,
                 room_index=room_index,
@@ -202,6 +208,19 @@ def _group_rooms_by_index(level_rooms: List[RoomData]) -> Dict[int, List[RoomDat
     return by_index
 
 
+def _index_bounds(by_index: Dict[int, List[RoomData]]) -> Optional[Tuple[int, int]]:
+    """Return (first, last) room index of a grouped level in one pass, or None if empty."""
+    lo = hi = None
+    for idx in by_index:
+        if lo is None:
+            lo = hi = idx
+        elif idx < lo:
+            lo = idx
+        elif idx > hi:
+            hi = idx
+    return None if lo is None else (lo, hi)
+
+
 def _wire_intra_level_doors(level_rooms: List[RoomData]) -> None:
     """Wire doors within a single level based on N -> N+1 rule.
 
@@ -252,21 +271,19 @@ def _wire_cross_level_doors(all_levels_rooms: List[List[RoomData]]) -> None:
     Last level's last index now loops back to level 1, room 1A (victory loop).
     """
     num_levels = len(all_levels_rooms)
+    # Group every level once; each level is read both as a source and a target
+    levels_by_index = [_group_rooms_by_index(level_rooms) for level_rooms in all_levels_rooms]
+    # First and last index of each level, found in a single scan per level
+    levels_bounds = [_index_bounds(by_index) for by_index in levels_by_index]
 
     for level_idx in range(num_levels - 1):
-        current_rooms = all_levels_rooms[level_idx]
-        next_rooms = all_levels_rooms[level_idx + 1]
-
-        if not current_rooms or not next_rooms:
-            continue
-
-        current_by_index = _group_rooms_by_index(current_rooms)
-        next_by_index = _group_rooms_by_index(next_rooms)
+        current_by_index = levels_by_index[level_idx]
+        next_by_index = levels_by_index[level_idx + 1]
 
         # Last index in current level (room_index 5 if present)
         if not current_by_index:
             continue
-        last_index = max(current_by_index.keys())
+        last_index = levels_bounds[level_idx][1]
         last_group = current_by_index.get(last_index, [])
         if not last_group:
             continue
@@ -274,7 +291,7 @@ def _wire_cross_level_doors(all_levels_rooms: List[List[RoomData]]) -> None:
         # First index in next level (room_index 0 if present)
         if not next_by_index:
             continue
-        first_index = min(next_by_index.keys())
+        first_index = levels_bounds[level_idx + 1][0]
         first_group = next_by_index.get(first_index, [])
         if not first_group:
             continue
@@ -289,20 +306,18 @@ def _wire_cross_level_doors(all_levels_rooms: List[List[RoomData]]) -> None:
     
     # Add exit for final boss room (last level, last index) - loops back to start
     if num_levels > 0 and all_levels_rooms[-1]:
-        final_level_rooms = all_levels_rooms[-1]
-        final_by_index = _group_rooms_by_index(final_level_rooms)
+        final_by_index = levels_by_index[-1]
         
         if final_by_index:
-            final_index = max(final_by_index.keys())
+            final_index = levels_bounds[-1][1]
             final_group = final_by_index.get(final_index, [])
             
             # Find first room of first level to loop back to
             if all_levels_rooms and all_levels_rooms[0]:
-                first_level_rooms = all_levels_rooms[0]
-                first_by_index = _group_rooms_by_index(first_level_rooms)
+                first_by_index = levels_by_index[0]
                 
                 if first_by_index:
-                    first_index = min(first_by_index.keys())
+                    first_index = levels_bounds[0][0]
                     first_group = first_by_index.get(first_index, [])
                     
                     if first_group:
@@ -326,8 +341,12 @@ def _compute_entrances(all_levels_rooms: List[List[RoomData]]) -> None:
     for room in code_to_room.values():
         room.entrance_from = None
 
-    # First source that points to a room becomes its entrance_from
+    # First source that points to a room becomes its entrance_from; rooms
+    # leave `pending` once assigned, so later edges into them are one lookup
+    pending = dict(code_to_room)
     for source in code_to_room.values():
+        if not pending:
+            break
         if not source.door_exits:
             continue
         for target_entry in source.door_exits.values():
@@ -336,8 +355,8 @@ def _compute_entrances(all_levels_rooms: List[List[RoomData]]) -> None:
                 target_code = target_entry.get('room_code')
             else:
                 target_code = target_entry
-            target = code_to_room.get(target_code)
-            if target is not None and target.entrance_from is None:
+            target = pending.pop(target_code, None)
+            if target is not None:
                 target.entrance_from = source.room_code
 
 
@@ -360,7 +379,6 @@ def _carve_spawn_and_exits_for_room(room: RoomData, config: PCGConfig, rng: rand
     if h < 3 or w < 3:
         return
 
-    room.areas = getattr(room, 'areas', []) or []
 
     def _add_area(kind: str, rect):
         room.areas.append({
@@ -375,7 +393,7 @@ def _carve_spawn_and_exits_for_room(room: RoomData, config: PCGConfig, rng: rand
     
     # Determine if we should place entrance
     should_place_entrance = allow_entrance and (
-        getattr(room, 'entrance_from', None) or is_first_room_first_level(room)
+        room.entrance_from or is_first_room_first_level(room)
     )
     
     # Entrance carve using quadrant system
@@ -403,7 +421,7 @@ def _carve_spawn_and_exits_for_room(room: RoomData, config: PCGConfig, rng: rand
                 used_quadrants.add(entrance_quadrant)
     
     # Exit carves using quadrant system
-    door_exits = getattr(room, 'door_exits', {})
+    door_exits = room.door_exits
     if door_exits:
         available_quadrants = ['TL', 'TR', 'BL', 'BR']
         
@@ -438,7 +456,7 @@ def _carve_drunken_walk_paths(room: RoomData, config: PCGConfig, rng: random.Ran
     Finds the entrance/exits for the room and carves paths between them.
     This version respects `exclusion_zone` areas recorded in `room.areas`.
     """
-    tile_grid = getattr(room, 'tiles', None)
+    tile_grid = room.tiles
     if not tile_grid:
         return
 
@@ -447,7 +465,7 @@ def _carve_drunken_walk_paths(room: RoomData, config: PCGConfig, rng: random.Ran
 
     # Build exclusion set from room.areas (rects)
     exclusion_set: Set[Tuple[int, int]] = set()
-    areas = getattr(room, 'areas', []) or []
+    areas = room.areas
     for area in areas:
         if not isinstance(area, dict):
             continue
@@ -496,18 +514,7 @@ def _carve_drunken_walk_paths(room: RoomData, config: PCGConfig, rng: random.Ran
 
     # If start is inside exclusion, try to find a nearby non-excluded tile
     if start_pos in exclusion_set:
-        found = None
-        for radius in (1, 2, 3):
-            for dy in range(-radius, radius + 1):
-                for dx in range(-radius, radius + 1):
-                    cand = (max(1, min(w - 2, start_pos[0] + dx)), max(1, min(h - 2, start_pos[1] + dy)))
-                    if cand not in exclusion_set:
-                        found = cand
-                        break
-                if found:
-                    break
-            if found:
-                break
+        found = _nearest_free_tile(start_pos, exclusion_set, w, h, 3)
         if found:
             start_pos = found
 
@@ -569,7 +576,6 @@ def _carve_drunken_walk_paths(room: RoomData, config: PCGConfig, rng: random.Ran
                     if 1 <= yy < h - 1 and 1 <= xx < w - 1:
                         tile_grid[yy][xx] = config.air_tile_id
             # record area so CA preserves it
-            room.areas = getattr(room, 'areas', []) or []
             room.areas.append({'kind': 'pocket_room', 'rects': [{'x': px, 'y': py, 'w': s, 'h': s}], 'properties': {}})
             carved_pocket = True
             # add the pocket center to all_paths so random extra walks may start from it
@@ -595,18 +601,7 @@ def _carve_drunken_walk_paths(room: RoomData, config: PCGConfig, rng: random.Ran
     # Determine hub (prefer room center but avoid exclusions)
     hub = (w // 2, h // 2)
     if hub in exclusion_set:
-        found = None
-        for radius in (1, 2, 3, 4):
-            for dy in range(-radius, radius + 1):
-                for dx in range(-radius, radius + 1):
-                    cand = (max(1, min(w - 2, hub[0] + dx)), max(1, min(h - 2, hub[1] + dy)))
-                    if cand not in exclusion_set:
-                        found = cand
-                        break
-                if found:
-                    break
-            if found:
-                break
+        found = _nearest_free_tile(hub, exclusion_set, w, h, 4)
         if found:
             hub = found
 
@@ -795,6 +790,34 @@ def _run_s_shaped_walk(tile_grid: List[List[int]], start_pos: Tuple[int,int], en
     return carved
 
 
+def _nearest_free_tile(pos: Tuple[int, int], exclusion_set: Set[Tuple[int,int]], w: int, h: int, max_radius: int) -> Optional[Tuple[int, int]]:
+    """Return the first interior tile near `pos` that is not excluded.
+
+    Squares of growing radius are searched in row-major order, clamped to the
+    interior. Every tile inside a failed square is excluded, so each radius
+    only checks its outer ring; the result is the same as rescanning squares.
+    """
+    px, py = pos
+    for radius in range(1, max_radius + 1):
+        for dy in range(-radius, radius + 1):
+            cy = max(1, min(h - 2, py + dy))
+            # The first square is scanned whole since it holds the centre
+            if radius == 1 or abs(dy) == radius:
+                dxs = range(-radius, radius + 1)
+            else:
+                dxs = (-radius, radius)
+            for dx in dxs:
+                cand = (max(1, min(w - 2, px + dx)), cy)
+                if cand not in exclusion_set:
+                    return cand
+    return None
+
+
+# Drunken-walk move pools, shared instead of rebuilt on every step
+_CARDINAL_MOVES = ((0,1),(0,-1),(1,0),(-1,0))
+_ALL_MOVES = _CARDINAL_MOVES + ((1,1),(1,-1),(-1,1),(-1,-1))
+
+
 def _run_single_walk(tile_grid: List[List[int]], start_pos: Tuple[int, int], end_pos: Tuple[int, int], config: PCGConfig, rng: random.Random, max_steps: int, exclusion_set: Optional[Set[Tuple[int,int]]] = None) -> List[Tuple[int, int]]:
     """Run a single drunkard walk carving into tile_grid and return carved tiles.
 
@@ -845,9 +868,7 @@ def _run_single_walk(tile_grid: List[List[int]], start_pos: Tuple[int, int], end
         if next_pos in exclusion_set:
             alt_found = False
             # try including diagonals if allowed
-            move_pool = [(0,1),(0,-1),(1,0),(-1,0)]
-            if getattr(config, 'dw_allow_diagonals', True):
-                move_pool += [(1,1),(1,-1),(-1,1),(-1,-1)]
+            move_pool = _ALL_MOVES if getattr(config, 'dw_allow_diagonals', True) else _CARDINAL_MOVES
             for _ in range(12):
                 adx, ady = rng.choice(move_pool)
                 candx = max(1, min(w - 2, current[0] + adx))
@@ -879,11 +900,21 @@ def _carve_at(tile_grid: List[List[int]], pos: Tuple[int, int], radius: int, con
     cx, cy = pos
     r = max(1, int(radius))
     offset = r - 1
-    for yy in range(cy - offset, cy + r):
-        for xx in range(cx - offset, cx + r):
-            # MODIFIED: Changed bounds to protect the outer wall (1 instead of 0)
-            if 1 <= yy < h - 1 and 1 <= xx < w - 1 and (xx, yy) not in exclusion_set:
-                tile_grid[yy][xx] = config.air_tile_id
+    # Clip the square to the interior up front (the outer wall is protected)
+    x0, x1 = max(1, cx - offset), min(w - 1, cx + r)
+    y0, y1 = max(1, cy - offset), min(h - 1, cy + r)
+    if x0 >= x1:
+        return
+    air = config.air_tile_id
+    span = [air] * (x1 - x0)
+    for yy in range(y0, y1):
+        row = tile_grid[yy]
+        if exclusion_set:
+            for xx in range(x0, x1):
+                if (xx, yy) not in exclusion_set:
+                    row[xx] = air
+        else:
+            row[x0:x1] = span
 
 
 def _get_drunken_move(current_pos: Tuple[int, int], target_pos: Tuple[int, int], config: PCGConfig, rng: random.Random, last_move: Optional[Tuple[int,int]] = None) -> Tuple[int, int]:
@@ -893,9 +924,6 @@ def _get_drunken_move(current_pos: Tuple[int, int], target_pos: Tuple[int, int],
     - `dw_persistence` is chance to repeat last_move (inertia).
     - `dw_allow_diagonals` permits diagonal steps occasionally.
     """
-    # Possible move pool
-    cardinal = [(0,1),(0,-1),(1,0),(-1,0)]
-    diag = [(1,1),(1,-1),(-1,1),(-1,-1)]
     allow_diags = bool(getattr(config, 'dw_allow_diagonals', True))
 
     # Persistence: sometimes keep last move
@@ -921,39 +949,102 @@ def _get_drunken_move(current_pos: Tuple[int, int], target_pos: Tuple[int, int],
             return (0, step_y)
 
     # Random move: choose from allowed set (cardinal + maybe diagonal)
-    pool = list(cardinal)
-    if allow_diags and rng.random() < 0.25:
-        pool.extend(diag)
+    pool = _ALL_MOVES if allow_diags and rng.random() < 0.25 else _CARDINAL_MOVES
     return rng.choice(pool)
 
 
 # ----- Connectivity check and repair -----
 
-def _flood_fill_reachable(tile_grid: List[List[int]], start: Tuple[int,int], config: PCGConfig) -> Set[Tuple[int,int]]:
-    """Return set of reachable air tiles from start using 4-way movement."""
+def _flood_fill_indices(tile_grid: List[List[int]], start: Tuple[int,int], config: PCGConfig) -> List[int]:
+    """Return reachable air tiles from start (4-way movement) as packed indices.
+
+    Indices address the grid padded with a one-tile border, so tile (x, y)
+    is `_packed_index((x, y), w, h)`; no (x, y) tuples are built.
+    """
     h = len(tile_grid)
     w = len(tile_grid[0]) if h>0 else 0
     sx, sy = start
     if sx < 0 or sx >= w or sy < 0 or sy >= h:
-        return set()
+        return []
     if tile_grid[sy][sx] != config.air_tile_id:
-        return set()
-
-    q = [start]
-    seen = {start}
-    for x,y in q:
-        for dx,dy in ((1,0),(-1,0),(0,1),(0,-1)):
-            nx, ny = x+dx, y+dy
-            if 0<=nx<w and 0<=ny<h and (nx,ny) not in seen and tile_grid[ny][nx]==config.air_tile_id:
-                seen.add((nx,ny))
-                q.append((nx,ny))
-    return seen
+        return []
+
+    # Flat open-tile mask padded with a closed border, so neighbours of any
+    # queued tile are always in range; tiles are cleared as they are queued,
+    # so the fill needs no per-tile tuples or set lookups.
+    air_id = config.air_tile_id
+    pw = w + 2
+    open_tiles = bytearray(pw * (h + 2))
+    for y, row in enumerate(tile_grid, 1):
+        base = y * pw + 1
+        open_tiles[base:base + w] = bytes(v == air_id for v in row)
+    start_k = (sy + 1) * pw + sx + 1
+    open_tiles[start_k] = 0
+    q = [start_k]
+    for k in q:
+        if open_tiles[k + 1]:
+            open_tiles[k + 1] = 0
+            q.append(k + 1)
+        if open_tiles[k - 1]:
+            open_tiles[k - 1] = 0
+            q.append(k - 1)
+        if open_tiles[k + pw]:
+            open_tiles[k + pw] = 0
+            q.append(k + pw)
+        if open_tiles[k - pw]:
+            open_tiles[k - pw] = 0
+            q.append(k - pw)
+    return q
+
+
+def _packed_index(pos: Tuple[int,int], w: int, h: int) -> int:
+    """Index of `pos` in the padded layout of `_flood_fill_indices`, or -1 if off-grid."""
+    x, y = pos
+    if 0 <= x < w and 0 <= y < h:
+        return (y + 1) * (w + 2) + x + 1
+    return -1
+
+
+def _unpack_indices(indices, w: int) -> Set[Tuple[int,int]]:
+    """Convert packed indices from `_flood_fill_indices` back to (x, y) tiles."""
+    pw = w + 2
+    return {(k % pw - 1, k // pw - 1) for k in indices}
+
+
+def _nearest_tile(tiles: Set[Tuple[int,int]], pos: Tuple[int,int]) -> Optional[Tuple[int,int]]:
+    """Return the tile in `tiles` closest to `pos` by Manhattan distance.
+
+    Tiles are bucketed by row and searched outward from `pos`'s row with a
+    bisect per row, stopping once the row gap alone exceeds the best match.
+    Ties go to the nearer row (upper first), then the left tile.
+    """
+    if not tiles:
+        return None
+    rows: Dict[int, List[int]] = {}
+    for x, y in tiles:
+        rows.setdefault(y, []).append(x)
+    px, py = pos
+    best = None
+    best_d = None
+    for y in sorted(rows, key=lambda ry: (abs(ry - py), ry)):
+        dy = abs(y - py)
+        if best_d is not None and dy >= best_d:
+            break
+        xs = rows[y]
+        xs.sort()
+        i = bisect_left(xs, px)
+        for j in (i - 1, i):
+            if 0 <= j < len(xs):
+                d = dy + abs(xs[j] - px)
+                if best_d is None or d < best_d:
+                    best, best_d = (xs[j], y), d
+    return best
 
 
 def _find_door_centers(room: RoomData) -> List[Tuple[str, Tuple[int,int]]]:
     """Return list of (door_key, center) from room.areas."""
     centers = []
-    areas = getattr(room, 'areas', []) or []
+    areas = room.areas
     for area in areas:
         if not isinstance(area, dict):
             continue
@@ -989,24 +1080,26 @@ def _ensure_doors_reachable(room: RoomData, config: PCGConfig, rng: random.Rando
     if entrance_center is None:
         return
 
-    reachable = _flood_fill_reachable(tile_grid, entrance_center, config)
+    # Reachability is kept as packed tile indices; (x, y) tuples are only
+    # built when an exit actually needs repairing
+    reachable = set(_flood_fill_indices(tile_grid, entrance_center, config))
 
     # For each exit, if unreachable, try targeted carving from closest reachable tile
     for key,pos in exits:
-        if pos in reachable:
+        if _packed_index(pos, w, h) in reachable:
             continue
         # find closest reachable tile by Manhattan distance
         if not reachable:
             continue
-        best = min(reachable, key=lambda p: abs(p[0]-pos[0]) + abs(p[1]-pos[1]))
+        best = _nearest_tile(_unpack_indices(reachable, w), pos)
         # attempt multiple repairs with increasing carve radius
         repaired = False
         for attempt_radius in (config.dw_carve_radius, max(1, config.dw_carve_radius-1), config.dw_carve_radius+1, config.dw_carve_radius+2):
             # run a short drunk walk from best -> pos with this brush
             _run_single_walk(tile_grid, best, pos, config, rng, max_steps=max(10, config.dw_max_steps//10))
             # re-evaluate reachable
-            reachable = _flood_fill_reachable(tile_grid, entrance_center, config)
-            if pos in reachable:
+            reachable = set(_flood_fill_indices(tile_grid, entrance_center, config))
+            if _packed_index(pos, w, h) in reachable:
                 repaired = True
                 break
         if not repaired:
@@ -1026,7 +1119,7 @@ def _ensure_doors_reachable(room: RoomData, config: PCGConfig, rng: random.Rando
                 # carve 3x3 at x,y
                 _carve_at(tile_grid, (x,y), max(2, config.dw_carve_radius), config)
             # final check
-            reachable = _flood_fill_reachable(tile_grid, entrance_center, config)
+            reachable = set(_flood_fill_indices(tile_grid, entrance_center, config))
         # done for this exit
 
     # no return (room.tiles modified in place)
@@ -1047,14 +1140,13 @@ def _run_cellular_automata(room: RoomData, config: PCGConfig, rng: random.Random
     room_size = len(room.tiles) * len(room.tiles[0]) if room.tiles else 0
     max_iterations = max(1, min(iterations, max(1, 10000 // max(room_size, 1))))
     if max_iterations < iterations:
-        import logging
-        logging.getLogger(__name__).info(f"Reducing CA iterations from {iterations} to {max_iterations} for room size {room_size}")
+        logger.info(f"Reducing CA iterations from {iterations} to {max_iterations} for room size {room_size}")
         iterations = max_iterations
 
     # Build protected sets from room.areas
     door_set: Set[Tuple[int,int]] = set()
     exclusion_set: Set[Tuple[int,int]] = set()
-    areas = getattr(room, 'areas', []) or []
+    areas = room.areas
     for area in areas:
         if not isinstance(area, dict):
             continue
@@ -1103,15 +1195,25 @@ def _run_cellular_automata(room: RoomData, config: PCGConfig, rng: random.Random
                         current_grid[yy][xx] = config.air_tile_id
     # end pocket expansion
 
-    import logging
-    logger = logging.getLogger(__name__)
-    
+    if h == 0 or w == 0:
+        return
+
+    # Iterate on the wall mask and convert back to tile ids once at the end
+    threshold = int(getattr(config, 'ca_wall_neighbor_threshold', 5))
+    include_diagonals = bool(getattr(config, 'ca_include_diagonals', True))
+    door_cells, wall_cells = _ca_override_cells(w, h, door_set, exclusion_set)
+    is_wall = [list(map(config.wall_tile_id.__eq__, row)) for row in current_grid]
+    _apply_ca_overrides(is_wall, door_cells, wall_cells)
     for i in range(iterations):
         if i > 0 and i % 2 == 0:  # Log every 2 iterations
             logger.debug(f"CA smoothing iteration {i+1}/{iterations}")
-        current_grid = _ca_smoothing_step(current_grid, config, door_set=door_set, exclusion_set=exclusion_set)
+        new_mask = _ca_smooth_mask(is_wall, w, h, threshold, include_diagonals, door_cells, wall_cells)
+        if new_mask == is_wall:
+            # Fixed point reached; further passes would reproduce the same mask
+            break
+        is_wall = new_mask
 
-    room.tiles = current_grid
+    room.tiles = _ca_mask_to_tiles(is_wall, w, h, config)
 
 
 def _post_ca_dilation(room: RoomData, config: PCGConfig) -> None:
@@ -1129,7 +1231,7 @@ def _post_ca_dilation(room: RoomData, config: PCGConfig) -> None:
         return
 
     # Build protected sets from room.areas so we don't overwrite doors/platforms/exclusions
-    areas = getattr(room, 'areas', []) or []
+    areas = room.areas
     protected: Set[Tuple[int,int]] = set()
     exclusion_set: Set[Tuple[int,int]] = set()
     for area in areas:
@@ -1159,92 +1261,106 @@ def _post_ca_dilation(room: RoomData, config: PCGConfig) -> None:
     grid = room.tiles
     h = len(grid)
     w = len(grid[0]) if h > 0 else 0
+    if h < 3 or w < 3:
+        return
 
+    # Per-row masks so the iterations below avoid per-tile set lookups
+    excluded = [[False] * w for _ in range(h)]
+    blocked = [[False] * w for _ in range(h)]
+    for x, y in exclusion_set:
+        if 0 <= x < w and 0 <= y < h:
+            excluded[y][x] = True
+            blocked[y][x] = True
+    for x, y in protected:
+        if 0 <= x < w and 0 <= y < h:
+            blocked[y][x] = True
+
+    air_id = config.air_tile_id
+    edge = [False] * w
+    inner = range(1, h - 1)
     for _ in range(iters):
-        to_air: Set[Tuple[int,int]] = set()
-        for y in range(1, h-1):
-            for x in range(1, w-1):
-                # never convert protected tiles
-                if (x,y) in protected or (x,y) in exclusion_set:
-                    continue
-                if grid[y][x] == config.air_tile_id:
-                    continue
-                # check neighbors within manhattan radius
-                found = False
-                for dy in range(-radius, radius + 1):
-                    yy = y + dy
-                    if yy < 1 or yy >= h-1:
-                        continue
-                    max_dx = radius - abs(dy)
-                    for dx in range(-max_dx, max_dx + 1):
-                        xx = x + dx
-                        if xx < 1 or xx >= w-1:
-                            continue
-                        if grid[yy][xx] == config.air_tile_id and (xx,yy) not in exclusion_set:
-                            found = True
-                            break
-                    if found:
-                        break
-                if found:
-                    to_air.add((x,y))
+        # Interior air tiles (outside exclusions) seed the growth; `radius`
+        # 4-neighbor dilations inside the interior cover the Manhattan ball.
+        near = [edge] + [
+            [False] + [v == air_id and not e for v, e in zip(grid[y][1:w - 1], excluded[y][1:w - 1])] + [False]
+            for y in inner
+        ] + [edge]
+        for _ in range(radius):
+            near = [edge] + [
+                [False] + [c or u or d or l or r for u, c, d, l, r in
+                           zip(near[y - 1][1:w - 1], near[y][1:w - 1], near[y + 1][1:w - 1], near[y], near[y][2:])] + [False]
+                for y in inner
+            ] + [edge]
         # apply
-        for (x,y) in to_air:
-            grid[y][x] = config.air_tile_id
+        for y in inner:
+            row = grid[y]
+            near_row = near[y]
+            blocked_row = blocked[y]
+            for x in range(1, w - 1):
+                if near_row[x] and not blocked_row[x] and row[x] != air_id:
+                    row[x] = air_id
     # done
 
 
-def _ca_smoothing_step(tile_grid: List[List[int]], config: PCGConfig, door_set: Optional[Set[Tuple[int,int]]] = None, exclusion_set: Optional[Set[Tuple[int,int]]] = None) -> List[List[int]]:
-    """
-    Runs a single iteration of the CA simulation.
+def _ca_override_cells(w: int, h: int, door_set: Set[Tuple[int,int]], exclusion_set: Set[Tuple[int,int]]) -> Tuple[List[Tuple[int,int]], List[Tuple[int,int]]]:
+    """Return in-bounds (door carve, exclusion) cells; door carve wins over exclusion."""
+    door_cells = [(x, y) for x, y in door_set if 0 <= x < w and 0 <= y < h]
+    wall_cells = [(x, y) for x, y in exclusion_set if 0 <= x < w and 0 <= y < h and (x, y) not in door_set]
+    return door_cells, wall_cells
 
-    Preserves tiles in `door_set` as air and tiles in `exclusion_set` as walls.
-    """
-    if door_set is None:
-        door_set = set()
-    if exclusion_set is None:
-        exclusion_set = set()
-
-    h = len(tile_grid)
-    w = len(tile_grid[0]) if h > 0 else 0
-    if h == 0 or w == 0:
-        return tile_grid
-
-    new_grid: List[List[int]] = [[0] * w for _ in range(h)]
 
-    threshold = int(getattr(config, 'ca_wall_neighbor_threshold', 5))
-    include_diagonals = bool(getattr(config, 'ca_include_diagonals', True))
-
-    for y in range(h):
-        for x in range(w):
-            # Preserve border
-            if x == 0 or x == w - 1 or y == 0 or y == h - 1:
-                new_grid[y][x] = config.wall_tile_id
-                continue
+def _apply_ca_overrides(is_wall: List[List[bool]], door_cells: List[Tuple[int,int]], wall_cells: List[Tuple[int,int]]) -> None:
+    """Force exclusion cells to wall and door carve cells to air in `is_wall`."""
+    for x, y in wall_cells:
+        is_wall[y][x] = True
+    for x, y in door_cells:
+        is_wall[y][x] = False
 
-            # Preserve door carve as air
-            if (x, y) in door_set:
-                new_grid[y][x] = config.air_tile_id
-                continue
 
-            # Preserve exclusion zones as walls
-            if (x, y) in exclusion_set:
-                new_grid[y][x] = config.wall_tile_id
-                continue
+def _ca_smooth_mask(is_wall: List[List[bool]], w: int, h: int, threshold: int, include_diagonals: bool,
+                    door_cells: List[Tuple[int,int]], wall_cells: List[Tuple[int,int]]) -> List[List[bool]]:
+    """
+    One CA iteration on a wall mask that already has the overrides applied.
 
-            neighbor_count = _get_wall_neighbor_count(tile_grid, x, y, include_diagonals, config, door_set, exclusion_set)
+    Neighbor counts come from column sums over three rows at a time. The
+    result has the overrides applied again, so it can be fed straight back
+    in; border cells are walls unless a door carve override clears them.
+    """
+    if h < 3 or w < 3:
+        # Every tile is on the border
+        return [[True] * w for _ in range(h)]
+
+    new_mask: List[List[bool]] = [[True] * w]
+    for y in range(1, h - 1):
+        up, cur, down = is_wall[y - 1], is_wall[y], is_wall[y + 1]
+        if include_diagonals:
+            col = [a + b + c for a, b, c in zip(up, cur, down)]
+            inner = [l + m + r - c >= threshold for l, m, r, c in zip(col, col[1:], col[2:], cur[1:])]
+        else:
+            inner = [a + b + l + r >= threshold for a, b, l, r in zip(up[1:], down[1:], cur, cur[2:])]
+        new_mask.append([True] + inner + [True])
+    new_mask.append([True] * w)
+    _apply_ca_overrides(new_mask, door_cells, wall_cells)
+    return new_mask
 
-            if neighbor_count >= threshold:
-                new_grid[y][x] = config.wall_tile_id
-            else:
-                new_grid[y][x] = config.air_tile_id
 
-    return new_grid
+def _ca_mask_to_tiles(is_wall: List[List[bool]], w: int, h: int, config: PCGConfig) -> List[List[int]]:
+    """Convert a smoothed wall mask to tile ids; the border is always wall."""
+    wall_id = config.wall_tile_id
+    air_id = config.air_tile_id
+    if h < 3 or w < 3:
+        return [[wall_id] * w for _ in range(h)]
+    return [[wall_id] * w] + [
+        [wall_id] + [wall_id if m else air_id for m in row[1:w - 1]] + [wall_id]
+        for row in is_wall[1:h - 1]
+    ] + [[wall_id] * w]
 
 
-def _get_wall_neighbor_count(tile_grid: List[List[int]], x: int, y: int, include_diagonals: bool, config: PCGConfig, door_set: Optional[Set[Tuple[int,int]]] = None, exclusion_set: Optional[Set[Tuple[int,int]]] = None) -> int:
+def _ca_smoothing_step(tile_grid: List[List[int]], config: PCGConfig, door_set: Optional[Set[Tuple[int,int]]] = None, exclusion_set: Optional[Set[Tuple[int,int]]] = None) -> List[List[int]]:
     """
-    Counts the number of wall neighbors for a given tile. Treats out-of-bounds tiles as walls.
-    Respects door_set (treated as air) and exclusion_set (treated as wall).
+    Runs a single iteration of the CA simulation.
+
+    Preserves tiles in `door_set` as air and tiles in `exclusion_set` as walls.
     """
     if door_set is None:
         door_set = set()
@@ -1253,42 +1369,16 @@ def _get_wall_neighbor_count(tile_grid: List[List[int]], x: int, y: int, include
 
     h = len(tile_grid)
     w = len(tile_grid[0]) if h > 0 else 0
-    if w == 0:
-        return 8  # All neighbors are walls for empty grid
-    
-    count = 0
-
-    # Pre-calculate bounds to avoid repeated checks
-    min_x = max(0, x - 1)
-    max_x = min(w - 1, x + 1)
-    min_y = max(0, y - 1)
-    max_y = min(h - 1, y + 1)
-
-    for iy in range(min_y, max_y + 1):
-        for ix in range(min_x, max_x + 1):
-            if ix == x and iy == y:
-                continue
-            if not include_diagonals and (ix != x and iy != y):
-                continue
-
-            # Out of bounds counts as wall (handled by bounds above)
-            if ix < 0 or ix >= w or iy < 0 or iy >= h:
-                count += 1
-                continue
-
-            # Protected areas override raw grid value
-            if (ix, iy) in door_set:
-                # door carve considered air
-                continue
-            if (ix, iy) in exclusion_set:
-                count += 1
-                continue
-
-            if tile_grid[iy][ix] == config.wall_tile_id:
-                count += 1
-
-    return count
+    if h == 0 or w == 0:
+        return tile_grid
 
+    threshold = int(getattr(config, 'ca_wall_neighbor_threshold', 5))
+    include_diagonals = bool(getattr(config, 'ca_include_diagonals', True))
+    door_cells, wall_cells = _ca_override_cells(w, h, door_set, exclusion_set)
+    is_wall = [list(map(config.wall_tile_id.__eq__, row)) for row in tile_grid]
+    _apply_ca_overrides(is_wall, door_cells, wall_cells)
+    is_wall = _ca_smooth_mask(is_wall, w, h, threshold, include_diagonals, door_cells, wall_cells)
+    return _ca_mask_to_tiles(is_wall, w, h, config)
 
 
 def generate_simple_pcg_level_set(
@@ -1325,6 +1415,16 @@ def generate_simple_pcg_level_set(
     except Exception:
         place_all_doors_for_room = None
 
+    # Resolve postprocess helpers and the default movement profile once for
+    # the whole level set rather than once per room
+    try:
+        from src.level.pcg_postprocess import add_floating_platforms, add_enemy_spawn_areas
+        from src.utils.player_movement_profile import PlayerMovementProfile
+        # build a profile using game defaults; specific presets may be used later
+        profile = PlayerMovementProfile()
+    except Exception:
+        add_floating_platforms = add_enemy_spawn_areas = profile = None
+
     for level_rooms in all_levels_rooms:
         for room in level_rooms:
             # Step 1: Carve the 3x3 door areas (this also finds their locations)
@@ -1333,8 +1433,7 @@ def generate_simple_pcg_level_set(
             except Exception as e:
                 # Log and continue; do not let carve failures stop generation
                 try:
-                    import logging
-                    logging.getLogger(__name__).error(f"Failed _carve_spawn_and_exits_for_room: {e}")
+                    logger.error(f"Failed _carve_spawn_and_exits_for_room: {e}")
                 except Exception:
                     pass
                 pass
@@ -1344,8 +1443,7 @@ def generate_simple_pcg_level_set(
                 _carve_drunken_walk_paths(room, config, rng)
             except Exception as e:
                 try:
-                    import logging
-                    logging.getLogger(__name__).error(f"Failed _carve_drunken_walk_paths: {e}")
+                    logger.error(f"Failed _carve_drunken_walk_paths: {e}")
                 except Exception:
                     pass
                 pass
@@ -1363,39 +1461,31 @@ def generate_simple_pcg_level_set(
                 _ensure_doors_reachable(room, config, rng)
                 # Postprocess: add floating platforms to improve reachability
                 try:
-                    from src.level.pcg_postprocess import add_floating_platforms
-                    from src.utils.player_movement_profile import PlayerMovementProfile
-                    # build a profile using game defaults; specific presets may be used later
-                    profile = PlayerMovementProfile()
-                    # use conservative defaults; rng may be None in some contexts
-                    add_floating_platforms(room, profile=profile, config=config, rng=rng)
-                    try:
-                        from src.level.pcg_postprocess import add_enemy_spawn_areas
-                        # More spawn regions to spread enemies out: 3-6 regions per room
-                        add_enemy_spawn_areas(room, config=config, rng=rng, min_regions=3, max_regions=6)
-                    except Exception:
-                        pass
+                    if add_floating_platforms is not None:
+                        # use conservative defaults; rng may be None in some contexts
+                        add_floating_platforms(room, profile=profile, config=config, rng=rng)
+                        try:
+                            # More spawn regions to spread enemies out: 3-6 regions per room
+                            add_enemy_spawn_areas(room, config=config, rng=rng, min_regions=3, max_regions=6)
+                        except Exception:
+                            pass
                 except Exception:
                     # ignore postprocess failures; generation should continue
                     pass
             except Exception as e:
                 try:
-                    import logging
-                    logging.getLogger(__name__).error(f"Failed _run_cellular_automata or connectivity check: {e}")
+                    logger.error(f"Failed _run_cellular_automata or connectivity check: {e}")
                 except Exception:
                     pass
                 pass
 
             # Step 4: Place the actual door tiles into the carved-out grid
-            if getattr(room, 'placed_doors', None) is None:
-                room.placed_doors = []
             try:
                 if place_all_doors_for_room:
                     place_all_doors_for_room(room, rng=rng)
             except Exception as e:
                 try:
-                    import logging
-                    logging.getLogger(__name__).error(f"Failed place_all_doors_for_room: {e}")
+                    logger.error(f"Failed place_all_doors_for_room: {e}")
                 except Exception:
                     pass
                 pass
@@ -1418,8 +1508,6 @@ def generate_and_save_simple_pcg(
 
 
 if __name__ == "__main__":
-    import logging
-    logger = logging.getLogger(__name__)
     # Quick manual test: generate and log summary
     ls = generate_and_save_simple_pcg()
     for level in ls.levels:
@@ -10,8 +10,9 @@ import json
 import os
 import sys
 
-# Add project root to path for imports
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+# Ensure project root is on path when running this module directly
+if __name__ == "__main__":
+    sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from config import TILE_AIR, TILE_WALL
 
@@ -106,7 +107,29 @@ class RoomData:
     def __post_init__(self):
         if self.door_exits is None:
             self.door_exits = {}
-        # keep areas as-is (may be list of dicts)
+        # Always a list so door helpers can append without re-checking
+        if self.placed_doors is None:
+            self.placed_doors = []
+        # areas stay raw (list of dicts) but are always a list
+        if self.areas is None:
+            self.areas = []
+        # Door wall candidates filled lazily by door_utils; not a field, so never serialized
+        self._wall_candidates: Dict[str, List[Tuple[int, int]]] = {}
+
+
+def placed_door_entry(tx: int, ty: int, tile: int, role: str, exit_key: Optional[str] = None,
+                      target: Any = None, source: Optional[str] = None) -> Dict[str, Any]:
+    """Build one `RoomData.placed_doors` entry.
+
+    Entries stay plain dicts because they are written to JSON as-is and
+    read back with `.get`. Exits carry `exit_key`/`target`, the entrance
+    carries `source`.
+    """
+    if role == "exit":
+        return {"tx": tx, "ty": ty, "tile": tile, "role": role, "exit_key": exit_key, "target": target}
+    if role == "entrance":
+        return {"tx": tx, "ty": ty, "tile": tile, "role": role, "source": source}
+    return {"tx": tx, "ty": ty, "tile": tile, "role": role}
 
 
 @dataclass
@@ -303,7 +326,9 @@ def build_tile_region_map(room_tiles_width: int, room_tiles_height: int, regions
     Clamps rects to room bounds.
     """
     tile_map: Dict[Tuple[int,int], List[AreaRegion]] = {}
-    for region in regions:
+    # Visit regions by priority (higher first, stable) so every per-tile list
+    # is built already sorted instead of sorting each list afterwards
+    for region in sorted(regions, key=lambda r: r.priority, reverse=True):
         for rect in region.rects:
             rx0 = max(0, rect.x)
             ry0 = max(0, rect.y)
@@ -312,9 +337,6 @@ def build_tile_region_map(room_tiles_width: int, room_tiles_height: int, regions
             for yy in range(ry0, ry1):
                 for xx in range(rx0, rx1):
                     tile_map.setdefault((xx, yy), []).append(region)
-    # Sort region lists by priority (higher first)
-    for coords, regs in tile_map.items():
-        regs.sort(key=lambda r: r.priority, reverse=True)
     return tile_map
 
 
@@ -365,15 +387,14 @@ def generate_room_tiles(
             row = [config.wall_tile_id] * width
             grid.append(row)
     else:
-        # Backwards-compatible: border walls and air interior
+        # Backwards-compatible: border walls and air interior, built per row
+        wall_id = config.wall_tile_id
+        air_id = config.air_tile_id
         for y in range(height):
-            row: List[int] = []
-            for x in range(width):
-                # Border walls
-                if x == 0 or x == width - 1 or y == 0 or y == height - 1:
-                    row.append(config.wall_tile_id)
-                else:
-                    row.append(config.air_tile_id)
+            if y == 0 or y == height - 1 or width <= 2:
+                row = [wall_id] * width
+            else:
+                row = [wall_id] + [air_id] * (width - 2) + [wall_id]
             grid.append(row)
 
     # Do not place door tiles here. Door tiles are placed at load time
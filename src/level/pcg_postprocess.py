@@ -11,33 +11,71 @@ Fixes in this version:
 """
 from __future__ import annotations
 from typing import Tuple, List, Optional, Set
-from collections import deque
+from bisect import bisect_left, bisect_right
 import random
 
 from src.level.pcg_level_data import RoomData, PCGConfig
 from src.utils.player_movement_profile import PlayerMovementProfile
 
+# Shared generator for callers that do not pass their own rng
+_FALLBACK_RNG = random.Random()
 
-def _is_excluded(room: RoomData, x: int, y: int) -> bool:
-    areas = getattr(room, 'areas', []) or []
-    for a in areas:
+
+def _exclusion_rects(room: RoomData) -> List[Tuple[int, int, int, int]]:
+    out: List[Tuple[int, int, int, int]] = []
+    for a in room.areas:
         if not isinstance(a, dict):
             continue
         if a.get('kind') == 'exclusion_zone':
-            rects = a.get('rects') or []
-            for r in rects:
-                rx = int(r.get('x', 0))
-                ry = int(r.get('y', 0))
-                rw = int(r.get('w', 0))
-                rh = int(r.get('h', 0))
-                if rx <= x < rx + rw and ry <= y < ry + rh:
-                    return True
+            for r in a.get('rects') or []:
+                out.append((int(r.get('x', 0)), int(r.get('y', 0)), int(r.get('w', 0)), int(r.get('h', 0))))
+    return out
+
+
+def _exclusion_mask(room: RoomData) -> Tuple[bytearray, int, int]:
+    """Return a flat w*h mask (1 = excluded) for the room's exclusion zones.
+
+    The mask is stamped once with slice assignment and cached on the room;
+    it is rebuilt whenever `room.areas` is replaced or grows, or the grid
+    size changes.
+    """
+    areas = room.areas
+    tiles = room.tiles or []
+    h = len(tiles)
+    w = len(tiles[0]) if h > 0 else 0
+    n = len(areas) if areas else 0
+    cached = getattr(room, '_exclusion_cache', None)
+    if cached is not None and cached[0] is areas and cached[1] == n and cached[2] == w and cached[3] == h:
+        return cached[4], w, h
+
+    mask = bytearray(w * h)
+    for rx, ry, rw, rh in _exclusion_rects(room):
+        x0 = max(0, rx)
+        x1 = min(w, rx + rw)
+        if x1 <= x0:
+            continue
+        run = b'\x01' * (x1 - x0)
+        for yy in range(max(0, ry), min(h, ry + rh)):
+            base = yy * w
+            mask[base + x0:base + x1] = run
+    room._exclusion_cache = (areas, n, w, h, mask)
+    return mask, w, h
+
+
+def _is_excluded(room: RoomData, x: int, y: int) -> bool:
+    mask, w, h = _exclusion_mask(room)
+    if 0 <= x < w and 0 <= y < h:
+        return mask[y * w + x] == 1
+    # Off-grid queries are rare; check the raw rects directly
+    for rx, ry, rw, rh in _exclusion_rects(room):
+        if rx <= x < rx + rw and ry <= y < ry + rh:
+            return True
     return False
 
 
 def _is_in_door_carve_area(room: RoomData, x: int, y: int) -> bool:
     """Check if a position is within any door carve area."""
-    areas = getattr(room, 'areas', []) or []
+    areas = room.areas
     for a in areas:
         if not isinstance(a, dict):
             continue
@@ -53,18 +91,32 @@ def _is_in_door_carve_area(room: RoomData, x: int, y: int) -> bool:
     return False
 
 
+def _door_carve_rects(room: RoomData) -> List[Tuple[int, int, int, int]]:
+    out: List[Tuple[int, int, int, int]] = []
+    for a in room.areas:
+        if not isinstance(a, dict):
+            continue
+        if a.get('kind') == 'door_carve':
+            for r in a.get('rects') or []:
+                out.append((int(r.get('x', 0)), int(r.get('y', 0)), int(r.get('w', 0)), int(r.get('h', 0))))
+    return out
+
+
 def _platform_intersects_door_area(room: RoomData, x: int, y: int, width: int, height: int = 1) -> bool:
     """Check if a platform rectangle intersects any door carve area."""
-    # Check all tiles in the platform area
-    for py in range(y, y + height):
-        for px in range(x, x + width):
-            if _is_in_door_carve_area(room, px, py):
-                return True
+    # One AABB overlap test per door rect instead of a lookup per platform tile
+    if width <= 0 or height <= 0:
+        return False
+    x_end = x + width
+    y_end = y + height
+    for rx, ry, rw, rh in _door_carve_rects(room):
+        if rw > 0 and rh > 0 and x < rx + rw and rx < x_end and y < ry + rh and ry < y_end:
+            return True
     return False
 
 
 def _add_platform_area(room: RoomData, x: int, y: int, width: int = 1, height: int = 1) -> None:
-    areas = getattr(room, 'areas', []) or []
+    areas = room.areas
     areas.append({
         'kind': 'platform',
         'rects': [{'x': x, 'y': y, 'w': width, 'h': height}],
@@ -86,7 +138,7 @@ def _is_platform_too_close(
     min_gap in all directions; if the proposed platform intersects that zone
     the function returns True (too close).
     """
-    areas = getattr(room, 'areas', []) or []
+    areas = room.areas
     new_x_min = new_x
     new_y_min = new_y
     new_x_max = new_x + new_w
@@ -116,7 +168,7 @@ def _is_platform_too_close(
 
 
 def _find_entrance_positions(room: RoomData, tiles: List[List[int]], air_id: int) -> List[Tuple[int,int]]:
-    areas = getattr(room, 'areas', []) or []
+    areas = room.areas
     out: List[Tuple[int,int]] = []
     h = len(tiles)
     w = len(tiles[0]) if h > 0 else 0
@@ -142,7 +194,7 @@ def _find_entrance_positions(room: RoomData, tiles: List[List[int]], air_id: int
 
 def _collect_exit_rects(room: RoomData) -> List[Tuple[str, int, int, int, int]]:
     out: List[Tuple[str,int,int,int,int]] = []
-    areas = getattr(room, 'areas', []) or []
+    areas = room.areas
     for a in areas:
         if not isinstance(a, dict):
             continue
@@ -155,15 +207,17 @@ def _collect_exit_rects(room: RoomData) -> List[Tuple[str, int, int, int, int]]:
     return out
 
 
+def _standable_rows(tiles: List[List[int]], air_id: int, wall_id: int) -> List[List[int]]:
+    """Return, per row, the ascending x positions of air tiles resting on a wall."""
+    rows: List[List[int]] = [[] for _ in range(len(tiles))]
+    # Pair each row with the one below it instead of double-indexing per tile
+    for y, (row, below) in enumerate(zip(tiles, tiles[1:])):
+        rows[y] = [x for x, v in enumerate(row) if v == air_id and below[x] == wall_id]
+    return rows
+
+
 def _standable_tiles(tiles: List[List[int]], air_id: int, wall_id: int) -> Set[Tuple[int,int]]:
-    h = len(tiles)
-    w = len(tiles[0]) if h > 0 else 0
-    out: Set[Tuple[int,int]] = set()
-    for y in range(0, h - 1):
-        for x in range(0, w):
-            if tiles[y][x] == air_id and tiles[y+1][x] == wall_id:
-                out.add((x,y))
-    return out
+    return {(x, y) for y, xs in enumerate(_standable_rows(tiles, air_id, wall_id)) for x in xs}
 
 
 def _reachable_from_entrance(
@@ -173,13 +227,26 @@ def _reachable_from_entrance(
     config: PCGConfig,
     tile_size: int,
     consider_exclusion: Optional[callable] = None,  # type: ignore
+    stop_at: Optional[Set[Tuple[int,int]]] = None,
 ) -> Set[Tuple[int,int]]:
+    """Return standable tiles reachable from `entrance_positions`.
+
+    With `stop_at`, the search ends at the first of those tiles it reaches and
+    the result is partial (it still holds that tile); otherwise it is complete.
+    """
     h = len(tiles)
     w = len(tiles[0]) if h > 0 else 0
     air_id = config.air_tile_id
     wall_id = config.wall_tile_id
 
-    standable = _standable_tiles(tiles, air_id, wall_id)
+    # One scan gives both the per-row sorted x table used by the jump window
+    # below and a byte mask per row for membership tests
+    standable_xs = _standable_rows(tiles, air_id, wall_id)
+    standable = [bytearray(w) for _ in range(h)]
+    for y, xs in enumerate(standable_xs):
+        row = standable[y]
+        for x in xs:
+            row[x] = 1
 
     h_single_px, d_single_px = profile.compute_single_jump_metrics()
     use_double = (profile.double_jumps + profile.extra_jump_charges) > 0
@@ -193,46 +260,56 @@ def _reachable_from_entrance(
     tile_h = max(1, int(max_h_px // max(1, tile_size)))
     tile_d = max(1, int(max_d_px // max(1, tile_size)))
 
-    q = deque()
-    seen: Set[Tuple[int,int]] = set()
+    # Plain list used as the BFS queue: iterating it while appending visits
+    # tiles in FIFO order without deque pops
+    q: List[Tuple[int,int]] = []
+    # Visited tiles as per-row byte masks; `order` keeps first-visit order so
+    # the returned set is built exactly as incremental adds would build it.
+    seen_rows = [bytearray(w) for _ in range(h)]
+    order: List[Tuple[int,int]] = []
 
     for ex, ey in entrance_positions:
-        if (ex, ey) in standable:
-            q.append((ex, ey)); seen.add((ex, ey)); continue
-        for fy in range(ey, h - 1):
-            if (ex, fy) in standable:
-                q.append((ex, fy)); seen.add((ex, fy)); break
+        if 0 <= ex < w and 0 <= ey < h and standable[ey][ex]:
+            q.append((ex, ey)); seen_rows[ey][ex] = 1; order.append((ex, ey)); continue
+        for fy in range(max(0, ey), h - 1 if 0 <= ex < w else 0):
+            if standable[fy][ex]:
+                q.append((ex, fy)); seen_rows[fy][ex] = 1; order.append((ex, fy)); break
         for dx in (-1, 1, -2, 2):
             nx = ex + dx
             if 0 <= nx < w:
-                for fy in range(ey, h - 1):
-                    if (nx, fy) in standable:
-                        if (nx, fy) not in seen:
-                            q.append((nx, fy)); seen.add((nx, fy)); break
+                for fy in range(max(0, ey), h - 1):
+                    if standable[fy][nx]:
+                        if not seen_rows[fy][nx]:
+                            q.append((nx, fy)); seen_rows[fy][nx] = 1; order.append((nx, fy)); break
 
-    while q:
-        x, y = q.popleft()
+    for x, y in q:
+        if stop_at and (x, y) in stop_at:
+            break
         for nx in (x - 1, x + 1):
-            if 0 <= nx < w and (nx, y) in standable and (nx, y) not in seen:
+            if 0 <= nx < w and standable[y][nx] and not seen_rows[y][nx]:
                 if consider_exclusion and consider_exclusion(nx, y):
                     pass
                 else:
-                    q.append((nx, y)); seen.add((nx, y))
+                    q.append((nx, y)); seen_rows[y][nx] = 1; order.append((nx, y))
         fy = y + 1
         while fy < h - 1:
-            if (x, fy) in standable:
-                if (x, fy) not in seen:
+            if standable[fy][x]:
+                if not seen_rows[fy][x]:
                     if consider_exclusion and consider_exclusion(x, fy):
                         break
-                    q.append((x, fy)); seen.add((x, fy))
+                    q.append((x, fy)); seen_rows[fy][x] = 1; order.append((x, fy))
                 break
             if tiles[fy][x] != air_id:
                 break
             fy += 1
         y_min = max(0, y - tile_h)
         for ty in range(y_min, y):
-            for tx in range(max(0, x - tile_d), min(w, x + tile_d + 1)):
-                if (tx, ty) in standable and (tx, ty) not in seen:
+            xs = standable_xs[ty]
+            if not xs:
+                continue
+            seen_row = seen_rows[ty]
+            for tx in xs[bisect_left(xs, x - tile_d):bisect_right(xs, x + tile_d)]:
+                if not seen_row[tx]:
                     clear = True
                     for cy in range(ty, y):
                         if tiles[cy][tx] != air_id:
@@ -241,8 +318,8 @@ def _reachable_from_entrance(
                         continue
                     if consider_exclusion and consider_exclusion(tx, ty):
                         continue
-                    q.append((tx, ty)); seen.add((tx, ty))
-    return seen
+                    q.append((tx, ty)); seen_row[tx] = 1; order.append((tx, ty))
+    return set(order)
 
 
 def _find_largest_run_in_list(sorted_positions: List[int], center: int) -> Tuple[int,int]:
@@ -284,8 +361,8 @@ def add_floating_platforms(
     vertical_clearance: int = 2,
     deco_chance: float = 0.35,
 ) -> int:
-    rng = rng or random.Random()
-    tiles = getattr(room, 'tiles', None)
+    rng = rng or _FALLBACK_RNG
+    tiles = room.tiles
     if not tiles:
         return 0
     h = len(tiles)
@@ -541,7 +618,7 @@ def add_floating_platforms(
                                 is_door_tile = True
                             else:
                                 # Also check if this position is in a door carve area
-                                room_areas = getattr(room, 'areas', []) or []
+                                room_areas = room.areas
                                 for a in room_areas:
                                     if a.get('kind') == 'door_carve':
                                         for r in a.get('rects', []):
@@ -623,7 +700,7 @@ def add_floating_platforms(
         build_connected_path(list(baseline_standable), exit_centers, f"entrance_to_{dk}", rng=rng)
 
     # 2. Build paths from pocket areas to exits (if pockets are trapped)
-    pocket_areas = [a for a in getattr(room, 'areas', []) or [] if isinstance(a, dict) and a.get('kind') == 'pocket_room']
+    pocket_areas = [a for a in room.areas if isinstance(a, dict) and a.get('kind') == 'pocket_room']
     for pocket in pocket_areas:
         rects = pocket.get('rects', []) or []
         if not rects:
@@ -655,11 +732,17 @@ def add_floating_platforms(
         build_connected_path(exit_centers, list(baseline_standable), f"{dk}_to_entrance", rng=rng)
 
     # Reverse pass: ensure player can return from exits to entrances
+    # Tiles only change here when a platform is kept (rejected ones are
+    # restored), so rescan standable tiles only after platforms_added moves.
+    standable_all: Optional[Set[Tuple[int,int]]] = None
+    standable_at = -1
     for dk, ex, ey, ew, eh in exits:
         if platforms_added >= max_platforms_per_room:
             break
         exit_starts: List[Tuple[int,int]] = []
-        standable_all = _standable_tiles(tiles, air_id, wall_id)
+        if standable_all is None or standable_at != platforms_added:
+            standable_all = _standable_tiles(tiles, air_id, wall_id)
+            standable_at = platforms_added
         for yy in range(ey, ey + eh):
             for xx in range(ex, ex + ew):
                 for fy in range(yy, h - 1):
@@ -671,7 +754,9 @@ def add_floating_platforms(
                 break
         if not exit_starts:
             continue
-        exit_reach = _reachable_from_entrance(tiles, exit_starts, profile, config, tile_size, consider_exclusion=lambda x,y: _is_excluded(room, x, y))
+        # Stopping at the first baseline tile keeps this a cheap connectivity
+        # check; when none is reachable the full set is needed below anyway
+        exit_reach = _reachable_from_entrance(tiles, exit_starts, profile, config, tile_size, consider_exclusion=lambda x,y: _is_excluded(room, x, y), stop_at=baseline_standable)
         if baseline_standable.intersection(exit_reach):
             continue
         # otherwise attempt to build staircase from the exit side toward the nearest baseline_standable
@@ -690,7 +775,7 @@ def add_floating_platforms(
         attempts = 0
         while attempts < 60 and platforms_added < max_platforms_per_room:
             attempts += 1
-            exit_reach = _reachable_from_entrance(tiles, exit_starts, profile, config, tile_size, consider_exclusion=lambda x,y: _is_excluded(room, x, y))
+            exit_reach = _reachable_from_entrance(tiles, exit_starts, profile, config, tile_size, consider_exclusion=lambda x,y: _is_excluded(room, x, y), stop_at={(tx, ty)})
             if (tx, ty) in exit_reach:
                 break
             h_single_px, _ = profile.compute_single_jump_metrics()
@@ -769,7 +854,7 @@ def add_floating_platforms(
                 continue
 
     # Pocket escape pass: ensure pocket_room areas are not trapping the player
-    pocket_areas = [a for a in getattr(room, 'areas', []) or [] if isinstance(a, dict) and a.get('kind') == 'pocket_room']
+    pocket_areas = [a for a in room.areas if isinstance(a, dict) and a.get('kind') == 'pocket_room']
     for a in pocket_areas:
         if platforms_added >= max_platforms_per_room:
             break
@@ -822,7 +907,7 @@ def add_floating_platforms(
         while attempts < 40 and platforms_added < max_platforms_per_room:
             attempts += 1
             # check if any baseline standable is now reachable from this pocket start
-            reach_from_pocket = _reachable_from_entrance(tiles, [(cur_x, cur_y)], profile, config, tile_size, consider_exclusion=lambda x,y: _is_excluded(room, x, y))
+            reach_from_pocket = _reachable_from_entrance(tiles, [(cur_x, cur_y)], profile, config, tile_size, consider_exclusion=lambda x,y: _is_excluded(room, x, y), stop_at=baseline_standable)
             if baseline_standable.intersection(reach_from_pocket):
                 break
             # place small platform toward target
@@ -999,8 +1084,8 @@ def add_enemy_spawn_areas(
     - Adds `properties.spawn_surface` = 'ground'|'air'|'both' to help runtime choose proper enemies.
     Returns number of regions added.
     """
-    rng = rng or random.Random()
-    tiles = getattr(room, 'tiles', None)
+    rng = rng or _FALLBACK_RNG
+    tiles = room.tiles
     if not tiles:
         return 0
     h = len(tiles)
@@ -1009,8 +1094,8 @@ def add_enemy_spawn_areas(
     air_id = config.air_tile_id
     wall_id = config.wall_tile_id
 
-    standable = _standable_tiles(tiles, air_id, wall_id)
-    if not standable:
+    standable_xs = _standable_rows(tiles, air_id, wall_id)
+    if not any(standable_xs):
         return 0
 
     # build protected set from existing areas
@@ -1020,7 +1105,7 @@ def add_enemy_spawn_areas(
     door_rects: List[Tuple[int,int,int,int]] = []
     platform_rects: List[Tuple[int,int,int,int]] = []
     
-    for a in getattr(room, 'areas', []) or []:
+    for a in room.areas:
         if not isinstance(a, dict):
             continue
         kind = a.get('kind')
@@ -1052,7 +1137,7 @@ def add_enemy_spawn_areas(
     for (drx, dry, drw, drh) in door_rects:
         # Check if this is an entrance door by looking at door_key in room areas
         is_entrance = False
-        for a in getattr(room, 'areas', []) or []:
+        for a in room.areas:
             if a.get('kind') == 'door_carve':
                 for r in a.get('rects', []):
                     if r.get('x') == drx and r.get('y') == dry:
@@ -1076,12 +1161,12 @@ def add_enemy_spawn_areas(
                     protected.add((xx, yy))
 
     # First: convert any pocket_room areas into full spawn regions (use 'both' surface)
-    pocket_areas = [a for a in getattr(room, 'areas', []) or [] if isinstance(a, dict) and a.get('kind') == 'pocket_room']
+    pocket_areas = [a for a in room.areas if isinstance(a, dict) and a.get('kind') == 'pocket_room']
     pocket_converted = 0
     if pocket_areas:
         # remove any existing spawn areas that overlap pocket rects, then add full-pocket spawn
         new_areas = []
-        existing_areas = getattr(room, 'areas', []) or []
+        existing_areas = room.areas
         for a in existing_areas:
             if not isinstance(a, dict) or a.get('kind') != 'spawn':
                 new_areas.append(a)
@@ -1157,18 +1242,21 @@ def add_enemy_spawn_areas(
                 pocket_converted += 1
 
     # Build horizontal runs of contiguous standable tiles (prefer bigger areas)
+    # Group each row's usable x positions (already ascending) into runs
     runs: List[Tuple[int,int,int]] = []  # (x0, y, length)
     for y in range(0, h - 1):
-        x = 1
-        while x < w - 1:
-            if (x, y) in standable and (x, y) not in protected:
-                start = x
-                x += 1
-                while x < w - 1 and (x, y) in standable and (x, y) not in protected:
-                    x += 1
-                runs.append((start, y, x - start))
-            else:
-                x += 1
+        start = prev = None
+        for x in standable_xs[y]:
+            if x < 1 or x >= w - 1 or (x, y) in protected:
+                continue
+            if prev is not None and x == prev + 1:
+                prev = x
+                continue
+            if start is not None:
+                runs.append((start, y, prev - start + 1))
+            start = prev = x
+        if start is not None:
+            runs.append((start, y, prev - start + 1))
 
     # Filter runs that are at least min_size long
     runs = [r for r in runs if r[2] >= min_size]
@@ -1182,7 +1270,6 @@ def add_enemy_spawn_areas(
     placed = 0
     used_tiles: Set[Tuple[int,int]] = set()
 
-    room.areas = getattr(room, 'areas', []) or []
 
     for start_x, ry, length in runs:
         if placed >= to_place:
@@ -1364,13 +1451,13 @@ def add_enemy_spawn_areas(
     # # But be less aggressive - only remove if platform actually blocks reachability
     # if not all(current_map.values()) and platforms_added > 0:
         # collect platform areas with their indices
-        platform_indices = [i for i, a in enumerate(getattr(room, 'areas', []) or []) if isinstance(a, dict) and a.get('kind') == 'platform']
+        platform_indices = [i for i, a in enumerate(room.areas) if isinstance(a, dict) and a.get('kind') == 'platform']
         # try platforms in reverse (last placed first)
         changed = True
         while changed and not all(current_map.values()):
             changed = False
             for idx in reversed(platform_indices):
-                areas_list = getattr(room, 'areas', []) or []
+                areas_list = room.areas
                 if idx < 0 or idx >= len(areas_list):
                     continue
                 a = areas_list[idx]
@@ -1433,7 +1520,7 @@ def add_enemy_spawn_areas(
                     current_map = new_map
                     changed = True
                     # update platform_indices to reflect shorter areas list
-                    platform_indices = [i for i, a in enumerate(getattr(room, 'areas', []) or []) if isinstance(a, dict) and a.get('kind') == 'platform']
+                    platform_indices = [i for i, a in enumerate(room.areas) if isinstance(a, dict) and a.get('kind') == 'platform']
                     # break to re-evaluate from newest platform again
                     break
                 else:
@@ -20,6 +20,9 @@ class Camera:
         # Smooth zoom transition
         if abs(self.zoom - self.target_zoom) > 0.01:
             self.zoom += (self.target_zoom - self.zoom) * self.zoom_transition_speed * dt
+        else:
+            # Settle exactly on the zoom level so per-zoom caches (e.g. level backgrounds) are hit
+            self.zoom = self.target_zoom
 
         # center target in world coordinates taking zoom into account
         tx = target_rect.centerx - (WIDTH / (2 * self.zoom))
@@ -1,7 +1,3 @@
-from typing import List, Dict, Tuple, Optional
-from .tile_types import TileType
-
-
 from typing import List, Dict, Tuple, Optional
 from .tile_types import TileType
 from ..core.constants import TILE_CHAR_MAP, LEGACY_CHAR_ALIASES, ENTITY_CHAR_MAP
@@ -80,23 +76,17 @@ class TileParser:
         if not tile_grid:
             return []
 
-        # Create reverse mapping from the canonical map
-        tile_to_ascii = {tile_type: char for char, tile_type in self.ascii_map.items()}
+        # Reverse mapping from the canonical map, keyed by raw tile value
+        value_to_ascii = {tile_type.value: char for char, tile_type in self.ascii_map.items()}
+        # Values without a character still have to be valid tile types
+        for tile_value in {v for row in tile_grid for v in row}.difference(value_to_ascii):
+            TileType(tile_value)
 
-        # Initialize with spaces
         height = len(tile_grid)
         width = max(len(row) for row in tile_grid) if tile_grid else 0
-        ascii_lines = [[' ' for _ in range(width)] for _ in range(height)]
 
-        # Convert tiles
-        for y in range(height):
-            for x in range(len(tile_grid[y])):
-                tile_value = tile_grid[y][x]
-                tile_type = TileType(tile_value)
-                if tile_type in tile_to_ascii:
-                    ascii_lines[y][x] = tile_to_ascii[tile_type]
-
-        # Add entity markers
+        # Bucket entity markers by row once; later entities win on overlap
+        markers_by_row: Dict[int, Dict[int, str]] = {}
         if entity_positions:
             # Create reverse mapping for entities
             entity_to_ascii = {v: k for k, v in self.entity_markers.items()}
@@ -105,10 +95,18 @@ class TileParser:
                     entity_char = entity_to_ascii[entity_type]
                     for x, y in positions:
                         if 0 <= y < height and 0 <= x < width:
-                            ascii_lines[y][x] = entity_char
-
-        # Convert to strings
-        return [''.join(line) for line in ascii_lines]
+                            markers_by_row.setdefault(y, {})[x] = entity_char
+
+        # Convert tiles; short rows are padded with spaces
+        ascii_lines = []
+        for y, row in enumerate(tile_grid):
+            line = [value_to_ascii.get(v, ' ') for v in row] + [' '] * (width - len(row))
+            markers = markers_by_row.get(y)
+            if markers:
+                for x, entity_char in markers.items():
+                    line[x] = entity_char
+            ascii_lines.append(''.join(line))
+        return ascii_lines
 
     def validate_ascii_level(self, ascii_level: List[str]) -> List[str]:
         """
@@ -141,27 +139,33 @@ class TileParser:
 
     def get_tile_info(self, ascii_char: str) -> Optional[str]:
         """Get information about what a character represents."""
+        # Follow alias chains iteratively, wrapping each hop around the final info
+        prefixes: List[str] = []
+        seen = set()
+        while ascii_char in LEGACY_CHAR_ALIASES and ascii_char not in self.ascii_map \
+                and ascii_char not in self.entity_markers and ascii_char not in seen:
+            seen.add(ascii_char)
+            ascii_char = LEGACY_CHAR_ALIASES[ascii_char]
+            prefixes.append(f"Legacy Alias for '{ascii_char}' (")
+
         if ascii_char in self.ascii_map:
             tile_type = self.ascii_map[ascii_char]
-            return f"Tile: {tile_type.name} ({tile_type.value})"
+            info = f"Tile: {tile_type.name} ({tile_type.value})"
         elif ascii_char in self.entity_markers:
-            return f"Entity: {self.entity_markers[ascii_char]}"
-        elif ascii_char in LEGACY_CHAR_ALIASES:
-            target_char = LEGACY_CHAR_ALIASES[ascii_char]
-            return f"Legacy Alias for '{target_char}' ({self.get_tile_info(target_char)})"
+            info = f"Entity: {self.entity_markers[ascii_char]}"
         else:
-            return "Unknown"
+            info = "Unknown"
+        return ''.join(prefixes) + info + ')' * len(prefixes)
 
     def print_legend(self):
         """Print a legend of all recognized characters."""
         import logging
         logger = logging.getLogger(__name__)
-        logger.info("=== Tile Legend ===")
-        for char, tile_type in self.ascii_map.items():
-            logger.info("  '%s' : %s", char, tile_type.name)
-        logger.info("\n=== Entity Legend ===")
-        for char, entity_type in self.entity_markers.items():
-            logger.info("  '%s' : %s", char, entity_type)
-        logger.info("\n=== Legacy Aliases ===")
-        for char, target in LEGACY_CHAR_ALIASES.items():
-            logger.info("  '%s' : Alias for '%s'", char, target)
\ No newline at end of file
+        lines = ["=== Tile Legend ==="]
+        lines.extend(f"  '{char}' : {tile_type.name}" for char, tile_type in self.ascii_map.items())
+        lines.append("\n=== Entity Legend ===")
+        lines.extend(f"  '{char}' : {entity_type}" for char, entity_type in self.entity_markers.items())
+        lines.append("\n=== Legacy Aliases ===")
+        lines.extend(f"  '{char}' : Alias for '{target}'" for char, target in LEGACY_CHAR_ALIASES.items())
+        # One record for the whole legend instead of one per line
+        logger.info("\n".join(lines))
\ No newline at end of file
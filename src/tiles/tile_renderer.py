@@ -24,7 +24,7 @@ class TileRenderer:
         
         # Chunk-based rendering cache for large PCG rooms
         self.chunk_size = 16  # 16x16 tile chunks
-        self.chunk_cache: Dict[str, Optional[pygame.Surface]] = {}  # key: "room_code_cx_cy_zoom"
+        self.chunk_cache: Dict[Tuple[str, int, int, float], Optional[pygame.Surface]] = {}  # key: (room_code, cx, cy, zoom)
         self.max_chunk_cache_size = 100  # Limit memory usage
 
     def render_tile(self, surface: pygame.Surface, tile_type: TileType,
@@ -385,7 +385,7 @@ class TileRenderer:
         """Render a single chunk with caching."""
         # Round zoom to reduce cache variations
         zoom_key = round(zoom, 1)
-        cache_key = f"{room_code}_{chunk_x}_{chunk_y}_{zoom_key}"
+        cache_key = (room_code, chunk_x, chunk_y, zoom_key)
 
         # Check if chunk is already cached
         if cache_key in self.chunk_cache:
@@ -516,7 +516,7 @@ class TileRenderer:
     
     def clear_chunk_cache_for_room(self, room_code: str):
         """Clear chunk cache for a specific room."""
-        keys_to_remove = [k for k in self.chunk_cache.keys() if k.startswith(f"{room_code}_")]
+        keys_to_remove = [k for k in self.chunk_cache if k[0] == room_code]
         for key in keys_to_remove:
             del self.chunk_cache[key]
     
@@ -532,10 +532,10 @@ class TileRenderer:
         max_chunk_y = (map_height + self.chunk_size - 1) // self.chunk_size
         
         # Generate all chunks
+        zoom_key = round(zoom, 1)
         for chunk_y in range(max_chunk_y):
             for chunk_x in range(max_chunk_x):
-                zoom_key = round(zoom, 1)
-                cache_key = f"{room_code}_{chunk_x}_{chunk_y}_{zoom_key}"
+                cache_key = (room_code, chunk_x, chunk_y, zoom_key)
                 
                 if cache_key not in self.chunk_cache:
                     chunk_surface = self._generate_chunk_surface(
@@ -11,6 +11,7 @@ Guidelines:
 """
 from typing import Tuple
 import logging
+import re
 import pygame
 
 from config import WIDTH, HEIGHT, FPS, CYAN, WHITE, WALL_JUMP_COOLDOWN, TILE
@@ -18,6 +19,10 @@ from src.core.utils import draw_text, resource_path
 
 logger = logging.getLogger(__name__)
 
+# PCG room codes: "<level><slot><letter>" (e.g. 11A), with a loose legacy fallback
+_ROOM_CODE_RE = re.compile(r"^(\d+?)([1-6][A-Za-z])$")
+_LEGACY_ROOM_CODE_RE = re.compile(r"^(\d+)(.+)$")
+
 # Cache for skill icons to prevent loading every frame (performance optimization)
 _skill_icon_cache = {}
 
@@ -104,15 +109,14 @@ def draw_hud(game, screen: pygame.Surface) -> None:
         # Room/Level info (PCG-aware)
         if getattr(game, 'use_pcg', False) and hasattr(game.level, 'room_code'):
             try:
-                import re
                 code = str(game.level.room_code)
-                m = re.match(r"^(\d+?)([1-6][A-Za-z])$", code)
+                m = _ROOM_CODE_RE.match(code)
                 if m:
                     lvl = int(m.group(1))
                     room_str = m.group(2)
                     draw_text(screen, f"Level:{lvl} Room:{room_str}", (WIDTH - 220, 8), WHITE, size=16)
                 else:
-                    m2 = re.match(r"^(\d+)(.+)$", code)
+                    m2 = _LEGACY_ROOM_CODE_RE.match(code)
                     if m2:
                         lvl = int(m2.group(1))
                         room_str = m2.group(2)
@@ -0,0 +1,39 @@
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+import pygame
+pygame.init()
+
+from config import WIDTH, HEIGHT
+from src.level.legacy_level import LegacyLevel
+from src.systems.camera import Camera
+
+screen = pygame.display.set_mode((WIDTH, HEIGHT))
+
+
+def _settle(camera, level):
+    target = pygame.Rect(*level.spawn, 24, 24)
+    for _ in range(300):
+        camera.update(target)
+
+
+def test_zoom_settles_on_zoom_level():
+    level = LegacyLevel(0)
+    camera = Camera()
+    for _ in range(len(camera.zoom_levels)):
+        camera.toggle_zoom()
+        _settle(camera, level)
+        assert camera.zoom == camera.zoom_levels[camera.current_zoom_index]
+
+
+def test_background_cache_used_after_toggle():
+    level = LegacyLevel(0)
+    camera = Camera()
+    camera.level_width, camera.level_height = level.w, level.h
+    # 1.5 -> 1.0 -> 1.2 -> 1.5; 1.2 has a fractional tile size and draws per tile
+    for _ in range(len(camera.zoom_levels)):
+        camera.toggle_zoom()
+        _settle(camera, level)
+        level.draw(screen, camera)
+        level.draw(screen, camera)
+        cached = level._background is not None and level._background[0] == camera.zoom
+        assert cached == (camera.zoom != 1.2)
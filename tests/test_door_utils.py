@@ -0,0 +1,56 @@
+import random
+
+from config import TILE_AIR, TILE_WALL
+from src.level import door_utils
+from src.level.pcg_level_data import RoomData
+from src.tiles.tile_types import TileType
+
+
+def _open_room(w=20, h=12):
+    tiles = [[TILE_WALL] * w for _ in range(h)]
+    for y in range(1, h - 1):
+        for x in range(1, w - 1):
+            tiles[y][x] = TILE_AIR
+    return RoomData(level_id=1, room_index=0, room_letter="A", room_code="1A", tiles=tiles)
+
+
+def test_multi_door_room_scans_grid_once(monkeypatch):
+    scans = []
+    compute = door_utils.compute_wall_candidates
+
+    def counting(tile_grid):
+        scans.append(1)
+        return compute(tile_grid)
+
+    monkeypatch.setattr(door_utils, "compute_wall_candidates", counting)
+    room = _open_room()
+    rng = random.Random(3)
+    doors = [TileType.DOOR_ENTRANCE, TileType.DOOR_EXIT_1, TileType.DOOR_EXIT_2]
+    for side, door in zip(("left", "right", "top"), doors):
+        tx, ty = door_utils.choose_wall_position(room.tiles, side, rng=rng, cache=room._wall_candidates)
+        door_utils.place_door(room.tiles, tx, ty, door, cache=room._wall_candidates)
+    assert len(scans) == 1
+
+
+def test_place_door_keeps_cache_in_sync():
+    room = _open_room()
+    cache = room._wall_candidates
+    door_utils.choose_wall_position(room.tiles, "left", rng=random.Random(0), cache=cache)
+    # Wall tiles, tiles next to walls and one tile in the middle of the room
+    for tx, ty, door in ((1, 4, TileType.DOOR_ENTRANCE), (2, 6, TileType.WALL),
+                         (17, 3, TileType.WALL), (5, 2, TileType.WALL),
+                         (8, 10, TileType.DOOR_EXIT_1), (9, 6, TileType.WALL)):
+        door_utils.place_door(room.tiles, tx, ty, door, cache=cache)
+        assert cache == door_utils.compute_wall_candidates(room.tiles)
+
+
+def test_fallback_picks_air_tiles_uniformly():
+    # No side has a safe door tile, so choose_wall_position falls back to the wall scan
+    tiles = [[TILE_WALL] * 8 for _ in range(12)]
+    air = [(1, 2), (1, 3), (6, 9)]
+    for x, y in air:
+        tiles[y][x] = TILE_AIR
+    counts = dict.fromkeys(air, 0)
+    for seed in range(6000):
+        counts[door_utils.choose_wall_position(tiles, "left", rng=random.Random(seed))] += 1
+    assert all(1800 <= n <= 2200 for n in counts.values()), counts